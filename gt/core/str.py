@@ -6,6 +6,7 @@ Code Namespace:
     core_str  # import gt.core.str as core_str
 """
 
+import functools
 import logging
 import re
 
@@ -14,6 +15,18 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Compiled once at import, so calls skip the pattern parsing/cache lookup
+_DIGITS_PATTERN = re.compile(r"\d+")
+_SIGNED_DIGITS_PATTERN = re.compile(r"-?\d+")  # Also keeps the negative "-" symbol in front of the number
+# Translation tables for ASCII strings (a single C-level pass instead of a per-character Python loop or regex)
+_DELETE_DIGITS_TABLE = str.maketrans("", "", "0123456789")
+_KEEP_DIGITS_TABLE = {code: None for code in range(128) if not 48 <= code <= 57}  # Deletes all non-digits
+_ASCII_DIGITS = frozenset("0123456789")
+_RANK_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")  # Indexed by last digit
+
+# Case conversions are pure and usually called with the same names (joints, attributes), so results are cached
+CASE_CONVERSION_CACHE_SIZE = 4096
+
 
 def remove_prefix(input_string, prefix):
     """
@@ -36,11 +49,11 @@ def remove_suffix(input_string, suffix):
     Removes suffix from a string (if found). It only removes in case it's a suffix.
     This function does NOT use replace
     Args:
-        input_string (str): Input to remove prefix from
+        input_string (str): Input to remove suffix from
         suffix (str): Suffix to remove (only if found)
 
     Returns:
-        str: String without prefix (if prefix was found)
+        str: String without suffix (if suffix was found)
     """
     if suffix and input_string.endswith(suffix):
         return input_string[: -len(suffix)]
@@ -60,17 +73,33 @@ def string_list_to_snake_case(string_list, separating_string="_", force_lowercas
     """
     if not string_list:
         return ""
+    return _string_tuple_to_snake_case(tuple(string_list), separating_string, force_lowercase)
+
+
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
+def _string_tuple_to_snake_case(string_tuple, separating_string, force_lowercase):
+    """
+    Cached implementation of "string_list_to_snake_case". Lists are not hashable, so a tuple is used as key.
+    Args:
+        string_tuple (tuple): A tuple of strings with combined words
+        separating_string (str): String used to separate words.
+        force_lowercase (bool): If it should force all words to be lowercase
+
+    Returns:
+        str: Combined string: e.g. ("camel", "Case") becomes "camel_case"
+    """
     result_string = ""
-    for index in range(len(string_list)):
+    for index in range(len(string_tuple)):
         if force_lowercase:
-            result_string += string_list[index].lower()
+            result_string += string_tuple[index].lower()
         else:
-            result_string += string_list[index]
-        if index != len(string_list) - 1:  # Last word doesn't need separating string
+            result_string += string_tuple[index]
+        if index != len(string_tuple) - 1:  # Last word doesn't need separating string
             result_string += separating_string
     return result_string
 
 
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
 def camel_to_snake(camel_case_string):
     """
     Uses "string_list_to_snake_case" and "camel_case_split" to convert camelCase to snake_case
@@ -90,15 +119,17 @@ def camel_case_split(input_string):
     Returns:
         list: A list with words
     """
-    words = [[input_string[0]]]
-
-    for char in input_string[1:]:
-        if words[-1][-1].islower() and char.isupper():
-            words.append(list(char))
-        else:
-            words[-1].append(char)
-
-    return ["".join(word) for word in words]
+    if not input_string:
+        return []
+    # Slice words out of the original string instead of building per-character lists
+    words = []
+    start = 0
+    for index in range(1, len(input_string)):
+        if input_string[index - 1].islower() and input_string[index].isupper():
+            words.append(input_string[start:index])
+            start = index
+    words.append(input_string[start:])
+    return words
 
 
 def remove_digits(input_string):
@@ -112,6 +143,8 @@ def remove_digits(input_string):
         str: output string without numbers (digits)
 
     """
+    if input_string.isascii():
+        return input_string.translate(_DELETE_DIGITS_TABLE)
     return "".join([i for i in input_string if not i.isdigit()])
 
 
@@ -125,6 +158,8 @@ def contains_digits(input_string):
     Returns:
         bool: True if the string contains digits, False otherwise.
     """
+    if input_string.isascii():
+        return not _ASCII_DIGITS.isdisjoint(input_string)  # Stops at the first digit found
     return any(char.isdigit() for char in input_string)
 
 
@@ -166,6 +201,7 @@ def remove_strings_from_string(input_string, undesired_string_list, only_prefix=
     return input_string
 
 
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
 def snake_to_camel(snake_case_str):
     """
     Converts a string from snake_case to camelCase.
@@ -189,11 +225,14 @@ def snake_to_camel(snake_case_str):
         snake_to_camel("python_is_awesome")
         # Output: "pythonIsAwesome"
     """
+    if "_" not in snake_case_str:  # Single word, nothing to join
+        return snake_case_str
     words = snake_case_str.split("_")
     camel_case_str = words[0] + "".join(word.capitalize() for word in words[1:])
     return camel_case_str
 
 
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
 def snake_to_title(snake_case_str):
     """
     Converts a snake_case string to a title case string.
@@ -204,6 +243,8 @@ def snake_to_title(snake_case_str):
     Returns:
         str: The formatted title case string.
     """
+    if "_" not in snake_case_str:  # Single word, nothing to join
+        return snake_case_str.capitalize()
     # Split the string by underscores and capitalize each word
     title_string = " ".join(word.capitalize() for word in snake_case_str.split("_"))
     return title_string
@@ -227,11 +268,10 @@ def extract_digits(input_string, can_be_negative=False):
         print(result)
         # Output: '11234567890'
     """
-    pattern = r"\d+"
-    if can_be_negative:
-        pattern = r"-?\d+"
-    digits_list = re.findall(pattern, input_string)
-    return "".join(digits_list)
+    if not can_be_negative and input_string.isascii():
+        return input_string.translate(_KEEP_DIGITS_TABLE)
+    pattern = _SIGNED_DIGITS_PATTERN if can_be_negative else _DIGITS_PATTERN
+    return "".join(pattern.findall(input_string))
 
 
 def extract_digits_as_int(input_string, only_first_match=True, can_be_negative=False, default=0):
@@ -249,11 +289,13 @@ def extract_digits_as_int(input_string, only_first_match=True, can_be_negative=F
     Returns:
         int: Extracted digits or "default" (0) if no digits are found. - Default can be defined as an argument.
     """
-    pattern = r"\d+"
-    if can_be_negative:
-        pattern = r"-?\d+"
+    if not input_string:
+        return default
+    if input_string.isascii() and input_string.isdigit():  # Whole string is a number, no scan needed
+        return int(input_string)
+    pattern = _SIGNED_DIGITS_PATTERN if can_be_negative else _DIGITS_PATTERN
     if only_first_match:
-        match = re.search(pattern, input_string)
+        match = pattern.search(input_string)
         return int(match.group()) if match else default
     else:
         extracted_digits = extract_digits(input_string, can_be_negative=can_be_negative)
@@ -279,22 +321,59 @@ def get_int_as_rank(num):
         get_int_as_rank(11)
         '11th'
     """
-    # Handle special cases for 11, 12, and 13 since they end in "th"
-    if 10 < num % 100 < 20:
-        suffix = "th"
-    else:
-        # Use modulo 10 to determine the last digit
-        last_digit = num % 10
-        if last_digit == 1:
-            suffix = "st"
-        elif last_digit == 2:
-            suffix = "nd"
-        elif last_digit == 3:
-            suffix = "rd"
-        else:
-            suffix = "th"
+    # Handle special cases for 11, 12, and 13 since they end in "th", otherwise use the last digit (modulo 10)
+    suffix = "th" if 10 < num % 100 < 20 else _RANK_SUFFIXES[num % 10]
+    return f"{num}{suffix}"
+
+
+_NUMBER_WORDS_UNDER_20 = (
+    "zero",
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+    "ten",
+    "eleven",
+    "twelve",
+    "thirteen",
+    "fourteen",
+    "fifteen",
+    "sixteen",
+    "seventeen",
+    "eighteen",
+    "nineteen",
+)
+_NUMBER_WORDS_TENS = ("", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety")
+_NUMBER_SCALES = ("", " thousand", " million", " billion")  # Trillions and above are handled separately
+
+
+def _get_hundreds_as_en(num):
+    """
+    Given an integer number between 1 and 999, returns an English word for it.
 
-    return str(num) + suffix
+    Args:
+        num (int): An integer (1-999) to be converted to English words.
+
+    Returns:
+        number (str): The input number as English words. e.g. "one hundred and twenty-three"
+    """
+    hundreds, rest = divmod(num, 100)
+    if rest < 20:
+        rest_words = _NUMBER_WORDS_UNDER_20[rest]
+    elif rest % 10 == 0:
+        rest_words = _NUMBER_WORDS_TENS[rest // 10]
+    else:
+        rest_words = f"{_NUMBER_WORDS_TENS[rest // 10]}-{_NUMBER_WORDS_UNDER_20[rest % 10]}"
+    if not hundreds:
+        return rest_words
+    if not rest:
+        return f"{_NUMBER_WORDS_UNDER_20[hundreds]} hundred"
+    return f"{_NUMBER_WORDS_UNDER_20[hundreds]} hundred and {rest_words}"
 
 
 def get_int_as_en(num):
@@ -307,89 +386,30 @@ def get_int_as_en(num):
     Returns:
         number (str): The input number as English words.
     """
-    digit_to_word = {
-        0: "zero",
-        1: "one",
-        2: "two",
-        3: "three",
-        4: "four",
-        5: "five",
-        6: "six",
-        7: "seven",
-        8: "eight",
-        9: "nine",
-        10: "ten",
-        11: "eleven",
-        12: "twelve",
-        13: "thirteen",
-        14: "fourteen",
-        15: "fifteen",
-        16: "sixteen",
-        17: "seventeen",
-        18: "eighteen",
-        19: "nineteen",
-        20: "twenty",
-        30: "thirty",
-        40: "forty",
-        50: "fifty",
-        60: "sixty",
-        70: "seventy",
-        80: "eighty",
-        90: "ninety",
-    }
-    thousand = 1000
-    million = thousand * 1000
-    billion = million * 1000
-    trillion = billion * 1000
+    trillion = 1000**4
 
     assert isinstance(num, int), "Input must be an integer."
 
-    negative = False
     if num < 0:
-        negative = True
-        num = abs(num)
-
-    neg_prefix = "negative " if negative else ""
-
-    if num < 20:
-        return neg_prefix + digit_to_word[num]
-
-    if num < 100:
-        if num % 10 == 0:
-            return neg_prefix + digit_to_word[num]
-        else:
-            return neg_prefix + f"{digit_to_word[num // 10 * 10]}-{digit_to_word[num % 10]}"
-
-    if num < thousand:
-        if num % 100 == 0:
-            return neg_prefix + f"{digit_to_word[num // 100]} hundred"
-        else:
-            return neg_prefix + f"{digit_to_word[num // 100]} hundred and {get_int_as_en(num % 100)}"
-
-    if num < million:
-        if num % thousand == 0:
-            return neg_prefix + f"{get_int_as_en(num // thousand)} thousand"
-        else:
-            return neg_prefix + f"{get_int_as_en(num // thousand)} thousand, {get_int_as_en(num % thousand)}"
-
-    if num < billion:
-        if (num % million) == 0:
-            return neg_prefix + f"{get_int_as_en(num // million)} million"
-        else:
-            return neg_prefix + f"{get_int_as_en(num // million)} million, {get_int_as_en(num % million)}"
-
-    if num < trillion:
-        if (num % billion) == 0:
-            return neg_prefix + f"{get_int_as_en(num // billion)} billion"
-        else:
-            return neg_prefix + f"{get_int_as_en(num // billion)} billion, {get_int_as_en(num % billion)}"
-
-    if num % trillion == 0:
-        return neg_prefix + f"{get_int_as_en(num // trillion)} trillion"
-    else:
-        return neg_prefix + f"{get_int_as_en(num // trillion)} trillion, {get_int_as_en(num % trillion)}"
-
-
+        return "negative " + get_int_as_en(abs(num))
+    if num == 0:
+        return _NUMBER_WORDS_UNDER_20[0]
+
+    # Trillions are the largest scale, anything above it is described as an amount of trillions
+    trillions, num = divmod(num, trillion)
+    parts = []
+    scale = 0
+    while num:
+        num, chunk = divmod(num, 1000)
+        if chunk:
+            parts.append(_get_hundreds_as_en(chunk) + _NUMBER_SCALES[scale])
+        scale += 1
+    if trillions:
+        parts.append(f"{get_int_as_en(trillions)} trillion")
+    return ", ".join(reversed(parts))
+
+
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
 def upper_first_char(input_string):
     """
     Capitalize the first letter of a string. Does nothing in case the string is empty ('')
@@ -403,19 +423,13 @@ def upper_first_char(input_string):
     Raises:
         ValueError: If the input string is None.
     """
-    # Check if the input string is None
     if input_string is None:
         raise ValueError("Invalid input type. Input string cannot be None")
-    # Check if the string is empty
-    if not input_string:
-        return input_string
-    # If the string has only one character, capitalize it
-    if len(input_string) == 1:
-        return input_string.upper()
-    # Capitalize the first letter and keep the rest of the string unchanged
-    return input_string[0].upper() + input_string[1:]
+    # Slicing covers empty and single character strings: "[:1]" and "[1:]" are simply empty
+    return input_string[:1].upper() + input_string[1:]
 
 
+@functools.lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
 def camel_to_title(input_string):
     """
     Converts a camel case string into title case.
@@ -434,6 +448,20 @@ def camel_to_title(input_string):
     return sentence.title()
 
 
+@functools.lru_cache(maxsize=256)
+def _get_alternation_pattern(substrings, flags=0):
+    """
+    Compiles (and caches) a pattern that matches any of the provided substrings. Longer substrings are tried first.
+    Args:
+        substrings (tuple): A tuple of literal strings to match. e.g. ("pie", "ana")
+        flags (int, optional): Regular expression flags used to compile the pattern. e.g. re.IGNORECASE
+    Returns:
+        re.Pattern: Compiled pattern. e.g. "ana|pie"
+    """
+    ordered = sorted(substrings, key=len, reverse=True)
+    return re.compile("|".join(re.escape(substring) for substring in ordered), flags)
+
+
 def filter_strings_by_prefix(strings, prefixes, case_sensitive=True):
     """
     Filters a list of words, returning only those that start with any of the given prefixes.
@@ -450,10 +478,13 @@ def filter_strings_by_prefix(strings, prefixes, case_sensitive=True):
         strings = [strings]
     if isinstance(prefixes, str):
         prefixes = [prefixes]
+    # "startswith" accepts a tuple, checking all prefixes in a single call
     if case_sensitive:
-        return [string for string in strings if any(string.startswith(prefix) for prefix in prefixes)]
+        prefixes = tuple(prefixes)
+        return [string for string in strings if string.startswith(prefixes)]
     else:
-        return [string for string in strings if any(string.lower().startswith(prefix.lower()) for prefix in prefixes)]
+        prefixes = tuple(prefix.lower() for prefix in prefixes)
+        return [string for string in strings if string.lower().startswith(prefixes)]
 
 
 def filter_strings_by_suffix(strings, suffixes, case_sensitive=True):
@@ -472,10 +503,13 @@ def filter_strings_by_suffix(strings, suffixes, case_sensitive=True):
         strings = [strings]
     if isinstance(suffixes, str):
         suffixes = [suffixes]
+    # "endswith" accepts a tuple, checking all suffixes in a single call
     if case_sensitive:
-        return [string for string in strings if any(string.endswith(suffix) for suffix in suffixes)]
+        suffixes = tuple(suffixes)
+        return [string for string in strings if string.endswith(suffixes)]
     else:
-        return [string for string in strings if any(string.lower().endswith(suffix.lower()) for suffix in suffixes)]
+        suffixes = tuple(suffix.lower() for suffix in suffixes)
+        return [string for string in strings if string.lower().endswith(suffixes)]
 
 
 def filter_strings_containing(strings, substrings, case_sensitive=True):
@@ -494,15 +528,22 @@ def filter_strings_containing(strings, substrings, case_sensitive=True):
         strings = [strings]
     if isinstance(substrings, str):
         substrings = [substrings]
+    if not substrings:
+        return []
     if case_sensitive:
-        return [string for string in strings if any(substring in string for substring in substrings)]
+        pattern = _get_alternation_pattern(tuple(substrings))  # Single scan per string instead of one per substring
+        return [string for string in strings if pattern.search(string)]
     else:
-        return [string for string in strings if any(substring.lower() in string.lower() for substring in substrings)]
+        # Lower substrings once, and each string once, instead of both on every comparison
+        pattern = _get_alternation_pattern(tuple(substring.lower() for substring in substrings))
+        return [string for string in strings if pattern.search(string.lower())]
 
 
 def replace_keys_with_values(input_string, replacements_dict, case_sensitive=True):
     """
     Replaces occurrences of keys in `input_string` with corresponding values from `replacements_dict`.
+    All keys are replaced in a single pass, so replaced values are not affected by other keys.
+    When keys overlap, the longest key is used. e.g. {"a": "b", "b": "c"} turns "ab" into "bc"
 
     Args:
         input_string (str): The string in which to perform replacements.
@@ -527,27 +568,37 @@ def replace_keys_with_values(input_string, replacements_dict, case_sensitive=Tru
     if not isinstance(replacements_dict, dict):
         raise ValueError("The replacements_dict must be a dictionary.")
 
-    if not case_sensitive:
-        # Create a case-insensitive version of the replacements dictionary
-        replacements_dict = {key.lower(): value for key, value in replacements_dict.items()}
-        lower_input_string = input_string.lower()
-        output_string = input_string
-
-        for key, value in replacements_dict.items():
-            start = 0
-            while start != -1:
-                start = lower_input_string.find(key, start)
-                if start != -1:
-                    end = start + len(key)
-                    output_string = output_string[:start] + value + output_string[end:]
-                    lower_input_string = lower_input_string[:start] + value.lower() + lower_input_string[end:]
-                    start += len(value)
-        return output_string
-    else:
-        for key, value in replacements_dict.items():
-            input_string = input_string.replace(key, value)
+    if not replacements_dict:
+        return input_string
 
-    return input_string
+    # Single pass over the input: a replaced value is never matched again by another key
+    if case_sensitive:
+        pattern = _get_alternation_pattern(tuple(replacements_dict))
+        return pattern.sub(lambda match: replacements_dict[match.group(0)], input_string)
+    # Create a case-insensitive version of the replacements dictionary
+    lower_replacements_dict = {key.lower(): value for key, value in replacements_dict.items()}
+    pattern = _get_alternation_pattern(tuple(lower_replacements_dict), re.IGNORECASE)
+    return pattern.sub(
+        lambda match: lower_replacements_dict.get(match.group(0).lower(), match.group(0)),
+        input_string,
+    )
+
+
+def clear_case_conversion_caches():
+    """
+    Clears the cached results of the case conversion functions.
+    e.g. "camel_to_snake", "snake_to_camel", "camel_to_title", "snake_to_title", "upper_first_char"
+    and "string_list_to_snake_case"
+    """
+    for cached_function in [
+        upper_first_char,
+        camel_to_snake,
+        snake_to_camel,
+        camel_to_title,
+        snake_to_title,
+        _string_tuple_to_snake_case,
+    ]:
+        cached_function.cache_clear()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ import gt.core.feedback as core_fback
 import gt.core.constraint as core_cnstr
 import maya.cmds as cmds
 import logging
+import math
 import sys
 
 # Logging Setup
@@ -25,6 +26,8 @@ class Vector3:
     Represents a 3D vector with x, y, and z coordinates.
     """
 
+    __slots__ = ("x", "y", "z")  # No per-instance __dict__, as many vectors are created when building rigs
+
     def __init__(self, x=0.0, y=0.0, z=0.0, xyz=None):
         """
         Initialize a Vector3 object using x, y, z coordinates
@@ -189,7 +192,7 @@ class Vector3:
         Returns:
             float: The magnitude of the vector.
         """
-        return (self.x**2 + self.y**2 + self.z**2) ** 0.5
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
     def dot(self, other):
         """
@@ -295,6 +298,8 @@ class Vector3:
 
 # ------------------------------------------------- Transform Start -----------------------------------------------
 class Transform:
+    __slots__ = ("position", "rotation", "scale")
+
     def __init__(self, position=None, rotation=None, scale=None):
         """
         Initialize a Transform object using Vector3 objects for position, rotation, and scale
@@ -807,14 +812,13 @@ def move_to_origin(obj):
 def move_selection_to_origin():
     """Moves selected objects back to origin"""
     function_name = "Move to Origin"
-    cmds.undoInfo(openChunk=True, chunkName=function_name)  # Start undo chunk
     selection = cmds.ls(selection=True)
-    selection_short = cmds.ls(selection=True)
 
     if not selection:
         cmds.warning("Nothing selected. Please select at least one object and try again.")
         return
 
+    cmds.undoInfo(openChunk=True, chunkName=function_name)  # Start undo chunk
     counter = 0
     errors = ""
     try:
@@ -841,7 +845,7 @@ def move_selection_to_origin():
         )
         if counter == 1:
             feedback = core_fback.FeedbackMessage(
-                intro=f'"{selection_short[0]}"',
+                intro=f'"{selection[0]}"',
                 style_intro=highlight_style,
                 conclusion="was moved to the",
                 suffix=pivot_pos,
@@ -1166,9 +1170,9 @@ def translate_shapes(obj_transform, offset):
     if not shapes:
         logger.debug("No shapes found for the given object.")
         return
-    for shape in shapes:
-        from gt.core.hierarchy import get_shape_components
+    from gt.core.hierarchy import get_shape_components
 
+    for shape in shapes:
         components = get_shape_components(shape)
         cmds.move(*offset, components, relative=True, objectSpace=True)
 
@@ -1185,13 +1189,13 @@ def rotate_shapes(obj_transform, offset, pivot=None):
     if not shapes:
         logger.debug("No shapes found for the given object.")
         return
-    for shape in shapes:
-        from gt.core.hierarchy import get_shape_components
+    from gt.core.hierarchy import get_shape_components
 
+    _rotate_parameters = {"relative": True, "objectSpace": True}
+    if pivot:
+        _rotate_parameters["pivot"] = pivot
+    for shape in shapes:
         components = get_shape_components(shape)
-        _rotate_parameters = {"relative": True, "objectSpace": True}
-        if pivot:
-            _rotate_parameters["pivot"] = pivot
         cmds.rotate(*offset, components, **_rotate_parameters)
 
 
@@ -1211,13 +1215,13 @@ def scale_shapes(obj_transform, offset, pivot=None):
         return
     if offset and isinstance(offset, (int, float)):
         offset = (offset, offset, offset)
-    for shape in shapes:
-        from gt.core.hierarchy import get_shape_components
+    from gt.core.hierarchy import get_shape_components
 
+    _scale_parameters = {"relative": True, "objectSpace": True}
+    if pivot:
+        _scale_parameters["pivot"] = pivot
+    for shape in shapes:
         components = get_shape_components(shape)
-        _scale_parameters = {"relative": True, "objectSpace": True}
-        if pivot:
-            _scale_parameters["pivot"] = pivot
         cmds.scale(*offset, components, **_scale_parameters)
 
 
@@ -1241,22 +1245,30 @@ def get_component_positions_as_dict(obj_transform, full_path=True, world_space=T
     if not obj_transform or not cmds.objExists(obj_transform):
         logger.warning(f"Unable to get component position dictionary. Missing object: {str(obj_transform)}")
         return {}
-    shapes = cmds.listRelatives(obj_transform, shapes=True, fullPath=True) or []
-    components = []
-    for shape in shapes:
-        from gt.core.hierarchy import get_shape_components
+    from gt.core.hierarchy import get_shape_components
 
-        components.extend(get_shape_components(shape=shape, mesh_component_type="vtx", full_path=full_path))
+    shapes = cmds.listRelatives(obj_transform, shapes=True, fullPath=True) or []
+    space_kwargs = {"worldSpace": True} if world_space else {"objectSpace": True}
     component_pos_dict = {}
-    for cv in components:
-        try:
-            if world_space:
-                pos = cmds.xform(cv, query=True, worldSpace=True, translation=True)
-            else:
-                pos = cmds.xform(cv, query=True, objectSpace=True, translation=True)
-            component_pos_dict[cv] = pos
-        except Exception as e:
-            logger.debug(f"Unable to get CV position. Issue: {e}")
+    for shape in shapes:
+        components = get_shape_components(shape=shape, mesh_component_type="vtx", full_path=full_path)
+        if not components:
+            continue
+        # Single-index components (vtx[i], cv[i]) can be queried at once, as xform returns them in index order
+        if cmds.nodeType(shape) in ("mesh", "nurbsCurve"):
+            try:
+                positions = cmds.xform(components, query=True, translation=True, **space_kwargs) or []
+                if len(positions) == len(components) * 3:
+                    for index, component in enumerate(components):
+                        component_pos_dict[component] = positions[index * 3 : index * 3 + 3]
+                    continue
+            except Exception as e:
+                logger.debug(f'Unable to get component positions for "{shape}" at once. Issue: {e}')
+        for cv in components:
+            try:
+                component_pos_dict[cv] = cmds.xform(cv, query=True, translation=True, **space_kwargs)
+            except Exception as e:
+                logger.debug(f"Unable to get CV position. Issue: {e}")
     return component_pos_dict
 
 
@@ -1280,12 +1292,10 @@ def set_component_positions_from_dict(component_pos_dict, world_space=True):
     if not isinstance(component_pos_dict, dict):
         logger.debug(f"Unable to set component positions. Invalid component position dictionary.")
         return
+    space_kwargs = {"worldSpace": True} if world_space else {"objectSpace": True}
     for cv, pos in component_pos_dict.items():
         try:
-            if world_space:
-                cmds.xform(cv, worldSpace=True, translation=pos)
-            else:
-                cmds.xform(cv, objectSpace=True, translation=pos)
+            cmds.xform(cv, translation=pos, **space_kwargs)
         except Exception as e:
             logger.debug(f"Unable to set CV position. Issue: {e}")
 
@@ -1316,7 +1326,8 @@ def get_directional_position(object_name, axis="X", tolerance=0.001):
         return center
 
     axis = axis.upper()
-    if axis not in ["X", "Y", "Z"]:
+    axis_index = {"X": 0, "Y": 1, "Z": 2}.get(axis)
+    if axis_index is None:
         logger.warning(f"Invalid axis '{axis}'. Please use 'X', 'Y', or 'Z'.")
         return center
 
@@ -1324,7 +1335,7 @@ def get_directional_position(object_name, axis="X", tolerance=0.001):
     world_position = cmds.xform(object_name, query=True, worldSpace=True, rotatePivot=True)
 
     # Get the value along the specified axis
-    position_value = world_position["XYZ".index(axis)]
+    position_value = world_position[axis_index]
 
     # Determine the position direction based on the position value
     if position_value < -tolerance:
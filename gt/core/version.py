@@ -9,6 +9,7 @@ from gt.core.feedback import print_when_true
 import gt.utils.request as utils_request
 from collections import namedtuple
 import importlib.util
+import functools
 import logging
 import os
 import re
@@ -27,6 +28,15 @@ VERSION_BIGGER = 1
 VERSION_SMALLER = -1
 VERSION_EQUAL = 0
 
+# Compiled once at import, so calls skip the pattern parsing/cache lookup
+_SEMANTIC_VERSION_PATTERN = re.compile(
+    r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-]"
+    r"[0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+"
+    r"(?:\.[0-9a-zA-Z-]+)*))?$"
+)
+_SEMANTIC_VERSION_NO_METADATA_PATTERN = re.compile(r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$")
+_NON_VERSION_CHARS_PATTERN = re.compile(r"[^\d.]")  # Anything that is not a digit or "."
+
 
 def is_semantic_version(version_str, metadata_ok=True):
     """
@@ -47,17 +57,30 @@ def is_semantic_version(version_str, metadata_ok=True):
         is_semantic_version("1.3.4-alpha", metadata_ok=True)  # True
     """
 
+    return _is_semantic_version_str(str(version_str), bool(metadata_ok))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_semantic_version_str(version_str, metadata_ok):
+    """
+    Cached pattern check used by "is_semantic_version". Version strings are checked repeatedly (installed, legacy
+    and released versions), so each string is only matched once. Input is always a string, so it's always hashable.
+
+    Args:
+        version_str (str): The version string to be checked.
+        metadata_ok (bool): If the build metadata suffix is accepted.
+
+    Returns:
+        bool: True if the version string matches the semantic versioning pattern, False otherwise.
+    """
     if metadata_ok:
-        pattern = (
-            r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-]"
-            r"[0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+"
-            r"(?:\.[0-9a-zA-Z-]+)*))?$"
-        )
+        pattern = _SEMANTIC_VERSION_PATTERN
     else:
-        pattern = r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$"
-    return bool(re.match(pattern, str(version_str)))
+        pattern = _SEMANTIC_VERSION_NO_METADATA_PATTERN
+    return bool(pattern.match(version_str))
 
 
+@functools.lru_cache(maxsize=128)
 def parse_semantic_version(version_string, as_tuple=False):
     """
     Parses semantic version string input into a tuple with major, minor and patch integers.
@@ -74,7 +97,7 @@ def parse_semantic_version(version_string, as_tuple=False):
                            e.g. (major=1, minor=2, patch=3)
     """
     try:
-        version_string = re.sub("[^\d.]", "", version_string)  # Remove non-digits (keeps ".")
+        version_string = _NON_VERSION_CHARS_PATTERN.sub("", version_string)  # Remove non-digits (keeps ".")
         major, minor, patch = map(int, version_string.split(".")[:3])
         if as_tuple:
             return SemanticVersion(major=major, minor=minor, patch=patch)
@@ -96,23 +119,10 @@ def compare_versions(version_a, version_b):
              0: if equal,
              1: if newer ("A" newer than "B")
     """
-    major_a, minor_a, patch_a = parse_semantic_version(version_a, as_tuple=True)
-    major_b, minor_b, patch_b = parse_semantic_version(version_b, as_tuple=True)
-
-    if major_a > major_b:
-        return VERSION_BIGGER
-    elif major_a < major_b:
-        return VERSION_SMALLER
-    elif minor_a > minor_b:
-        return VERSION_BIGGER
-    elif minor_a < minor_b:
-        return VERSION_SMALLER
-    elif patch_a > patch_b:
-        return VERSION_BIGGER
-    elif patch_a < patch_b:
-        return VERSION_SMALLER
-    else:
-        return VERSION_EQUAL
+    version_tuple_a = parse_semantic_version(version_a, as_tuple=True)
+    version_tuple_b = parse_semantic_version(version_b, as_tuple=True)
+    # Tuples compare major, then minor, then patch. Result matches VERSION_BIGGER, VERSION_SMALLER or VERSION_EQUAL
+    return (version_tuple_a > version_tuple_b) - (version_tuple_a < version_tuple_b)
 
 
 def get_package_version(package_path=None):
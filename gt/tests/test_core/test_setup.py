@@ -1,13 +1,16 @@
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock, DEFAULT, call
+import importlib
 import unittest
+import tempfile
 import logging
+import pathlib
 import sys
 import os
 
 # Logging Setup
 logging.basicConfig()
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.WARNING)
 
 # Import Utility and Maya Test Tools
 test_utils_dir = os.path.dirname(__file__)
@@ -17,39 +20,61 @@ for to_append in [package_root_dir, tests_dir]:
     if to_append not in sys.path:
         sys.path.append(to_append)
 from tests import maya_test_tools
-import gt.core.setup as core_setup
 
+core_setup = None  # Imported by "_import_modules_under_test" after Maya standalone is initialized
+PACKAGE_PREFS_DIR = None
+
+SEP = os.sep  # Fixture paths are controlled, no need for "os.path.join" normalization
+
+
+def _import_modules_under_test():
+    """
+    Imports "gt.core.setup" (and its dependency chain) only once Maya standalone is running, so any Maya calls made
+    while those modules load happen after initialization. This does not make test collection cheaper, since
+    "tests.maya_test_tools" already imports "maya.cmds" at module level.
+    """
+    global core_setup, PACKAGE_PREFS_DIR
+    core_setup = importlib.import_module("gt.core.setup")
+    PACKAGE_PREFS_DIR = importlib.import_module("gt.core.prefs").PACKAGE_PREFS_DIR
+
+
+def _split_dirs_and_files(names):
+    """
+    Splits a list of package requirement names into directories and files. (Assuming files have an extension)
+    Args:
+        names (list): A list of file or directory names. e.g. ["gt", "file.py"]
+    Returns:
+        tuple: Two lists, the first containing directory names and the second containing file names.
+    """
+    dirs = [name for name in names if "." not in name]
+    files = [name for name in names if "." in name]
+    return dirs, files
 
-class TestSetupCore(unittest.TestCase):
-    def setUp(self):
-        maya_test_tools.force_new_scene()
+
+class TestSetupCoreFS(unittest.TestCase):
+    """
+    Tests that only operate on the file system (no Maya scene state), so the scene is not reset between them.
+    """
 
     @classmethod
     def setUpClass(cls):
         maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+        _import_modules_under_test()
+        cls.USER_SETUP = core_setup.PACKAGE_USER_SETUP
+        cls.ENTRY_LINE = core_setup.PACKAGE_ENTRY_LINE
+        cls.ENTRY_LINE_NL = core_setup.PACKAGE_ENTRY_LINE + "\n"
+        cls.LEGACY_LINE_NL = core_setup.PACKAGE_LEGACY_LINE + "\n"
+        cls.NAME = core_setup.PACKAGE_NAME
+        cls.MAIN_MODULE = core_setup.PACKAGE_MAIN_MODULE
+        cls.REQUIREMENT_DIRS, cls.REQUIREMENT_FILES = _split_dirs_and_files(core_setup.PACKAGE_REQUIREMENTS)
+        cls.PACKAGE_DIRS, cls.PACKAGE_FILES = _split_dirs_and_files(core_setup.PACKAGE_DIRS)
 
-    def tearDown(self):
-        maya_test_tools.delete_test_temp_dir()
-
-    def test_get_maya_settings_dir_exists(self):
-        settings_dir = core_setup.get_maya_preferences_dir()
-        result = os.path.exists(settings_dir)
-        expected = True
-        self.assertEqual(expected, result)
-
-    def test_get_maya_settings_dir_is_folder(self):
-        settings_dir = core_setup.get_maya_preferences_dir()
-        result = os.path.isdir(settings_dir)
-        expected = True
-        self.assertEqual(expected, result)
+    def setUp(self):
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.temp_dir = self.temp_dir_obj.name
 
-    @patch("maya.cmds.about")
-    def test_get_maya_settings_dir_about_key(self, mock_about):
-        mock_about.return_value = "mocked_path"
-        core_setup.get_maya_preferences_dir()
-        result = str(mock_about.call_args)
-        expected = "call(preferences=True)"
-        self.assertEqual(expected, result)
+    def tearDown(self):
+        self.temp_dir_obj.cleanup()
 
     def test_get_package_requirements_keys(self):
         result = core_setup.get_package_requirements()
@@ -65,7 +90,7 @@ class TestSetupCore(unittest.TestCase):
             self.assertEqual(True, exists)
 
     def test_copy_package_requirements(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()  # Create test elements
+        test_temp_dir = self.temp_dir
         source_dir = os.path.join(test_temp_dir, "source_dir")
         target_dir = os.path.join(test_temp_dir, "target_dir")
         requirement_dir_one = os.path.join(source_dir, "dir_one")
@@ -74,16 +99,8 @@ class TestSetupCore(unittest.TestCase):
         undesired_pyc = os.path.join(source_dir, "empty.pyc")
         undesired_dir_one = os.path.join(requirement_dir_one, "__pycache__")
         undesired_dir_two = os.path.join(source_dir, "__pycache__")
-        for path in [
-            source_dir,
-            target_dir,
-            requirement_dir_one,
-            requirement_dir_two,
-            undesired_dir_one,
-            undesired_dir_two,
-        ]:
-            if not os.path.exists(path):
-                os.mkdir(path)
+        for path in [target_dir, requirement_dir_two, undesired_dir_one, undesired_dir_two]:
+            os.makedirs(path, exist_ok=True)  # Leaves only, intermediate directories are created with them
         for file in [requirement_py, undesired_pyc]:
             with open(file, "w"):
                 pass  # Create empty file
@@ -93,31 +110,25 @@ class TestSetupCore(unittest.TestCase):
             "empty.py": str(requirement_py),
         }
         core_setup.copy_package_requirements(target_folder=target_dir, package_requirements=mocked_package_requirements)
-        source_result = sorted(os.listdir(source_dir))
-        source_expected = sorted(["dir_one", "dir_two", "empty.py", "empty.pyc", "__pycache__"])
+        source_result = {entry.name for entry in os.scandir(source_dir)}
+        source_expected = {"dir_one", "dir_two", "empty.py", "empty.pyc", "__pycache__"}
         self.assertEqual(source_expected, source_result)
-        target_result = sorted(os.listdir(target_dir))
-        target_expected = sorted(["dir_one", "dir_two", "empty.py"])
+        target_result = {entry.name for entry in os.scandir(target_dir)}
+        target_expected = {"dir_one", "dir_two", "empty.py"}
         self.assertEqual(target_expected, target_result)
 
     def test_remove_previous_install(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()  # Create test elements
-        mocked_install_dir = os.path.join(test_temp_dir, core_setup.PACKAGE_NAME)
-        mocked_install_main_module = os.path.join(mocked_install_dir, core_setup.PACKAGE_MAIN_MODULE)
-        from gt.core.prefs import PACKAGE_PREFS_DIR
-
+        test_temp_dir = self.temp_dir
+        mocked_install_dir = os.path.join(test_temp_dir, self.NAME)
+        mocked_install_main_module = os.path.join(mocked_install_dir, self.MAIN_MODULE)
         mocked_install_prefs = os.path.join(mocked_install_dir, PACKAGE_PREFS_DIR)
         mocked_pyc = os.path.join(mocked_install_dir, "empty.pyc")
         mocked_py = os.path.join(mocked_install_dir, "empty.py")
-        for path in [mocked_install_dir, mocked_install_main_module, mocked_install_prefs]:
-            if not os.path.exists(path):
-                os.mkdir(path)
+        for path in [mocked_install_main_module, mocked_install_prefs]:
+            os.makedirs(path, exist_ok=True)
         for file in [mocked_pyc, mocked_py]:
             with open(file, "w"):
                 pass  # Create empty file
-        expected = True
-        result = os.path.exists(mocked_install_main_module)
-        self.assertEqual(expected, result)
         core_setup.remove_previous_install(target_path=mocked_install_dir)
         expected = False
         result = os.path.exists(mocked_install_main_module)
@@ -127,38 +138,30 @@ class TestSetupCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_remove_previous_install_clear_prefs(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()  # Create test elements
-        mocked_install_dir = os.path.join(test_temp_dir, core_setup.PACKAGE_NAME)
-        mocked_install_main_module = os.path.join(mocked_install_dir, core_setup.PACKAGE_MAIN_MODULE)
-        from gt.core.prefs import PACKAGE_PREFS_DIR
-
+        test_temp_dir = self.temp_dir
+        mocked_install_dir = os.path.join(test_temp_dir, self.NAME)
+        mocked_install_main_module = os.path.join(mocked_install_dir, self.MAIN_MODULE)
         mocked_install_prefs = os.path.join(mocked_install_dir, PACKAGE_PREFS_DIR)
-        for path in [mocked_install_dir, mocked_install_main_module, mocked_install_prefs]:
-            if not os.path.exists(path):
-                os.mkdir(path)
+        for path in [mocked_install_main_module, mocked_install_prefs]:
+            os.makedirs(path, exist_ok=True)
         core_setup.remove_previous_install(target_path=mocked_install_dir, clear_prefs=True)
         expected = False
         result = os.path.exists(mocked_install_dir)
         self.assertEqual(expected, result)
 
     def test_check_installation_integrity(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()  # Create test elements
-        for requirement in core_setup.PACKAGE_REQUIREMENTS:
-            if "." in requirement:  # Assuming files have an extension
-                with open(os.path.join(test_temp_dir, requirement), "w"):
-                    pass
-            else:
-                dir_path = os.path.join(test_temp_dir, requirement)
-                if not os.path.exists(dir_path):
-                    os.mkdir(dir_path)
-        for requirement in core_setup.PACKAGE_DIRS:
-            if "." in requirement:  # Assuming files have an extension
-                with open(os.path.join(test_temp_dir, core_setup.PACKAGE_MAIN_MODULE, requirement), "w"):
-                    pass
-            else:
-                dir_path = os.path.join(test_temp_dir, core_setup.PACKAGE_MAIN_MODULE, requirement)
-                if not os.path.exists(dir_path):
-                    os.mkdir(dir_path)
+        test_temp_dir = self.temp_dir
+        main_module_dir = os.path.join(test_temp_dir, self.MAIN_MODULE)
+        for requirement in self.REQUIREMENT_DIRS:
+            os.makedirs(os.path.join(test_temp_dir, requirement), exist_ok=True)
+        for requirement in self.PACKAGE_DIRS:
+            os.makedirs(os.path.join(main_module_dir, requirement), exist_ok=True)
+        for requirement in self.REQUIREMENT_FILES:
+            with open(os.path.join(test_temp_dir, requirement), "w"):
+                pass  # Create empty file
+        for requirement in self.PACKAGE_FILES:
+            with open(os.path.join(main_module_dir, requirement), "w"):
+                pass  # Create empty file
         result = core_setup.check_installation_integrity(package_target_folder=test_temp_dir)
         expected = True
         self.assertEqual(expected, result)
@@ -166,289 +169,149 @@ class TestSetupCore(unittest.TestCase):
     @patch("gt.core.setup.get_available_maya_preferences_dirs")
     def test_generate_scripts_dir_list_invalid_preferences(self, mock_get_preferences):
         mock_get_preferences.return_value = {"1234": "invalid_path"}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=False)
-        expected = []
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_not_existing(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=False)
-        expected = [os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)]
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_existing_false(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=True)
+        result = core_setup.generate_scripts_dir_list(file_name=self.USER_SETUP, only_existing=False)
         expected = []
         self.assertEqual(expected, result)
 
     @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_existing_true(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w"):
-            pass  # Create empty file
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=True)
-        expected = [os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)]
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_add_entry_line_existing_default(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w"):
-            pass  # Create empty file
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        core_setup.add_entry_line(file_path=mocked_file_name, create_missing_file=False)
-        expected = [core_setup.PACKAGE_ENTRY_LINE + "\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_add_entry_line_not_existing(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        core_setup.add_entry_line(file_path=mocked_file_name, create_missing_file=True)
-        expected = [core_setup.PACKAGE_ENTRY_LINE + "\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_add_entry_line_with_content(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write("# Mocked content")
+    def test_generate_scripts_dir_list(self, mock_get_preferences):
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
+        os.makedirs(mocked_scripts_dir, exist_ok=True)
         mock_get_preferences.return_value = {"2020": test_temp_dir}
-        core_setup.add_entry_line(file_path=mocked_file_name, create_missing_file=True)
-        expected = ["# Mocked content\n", f"{core_setup.PACKAGE_ENTRY_LINE}\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
+        # (only_existing, file_exists, expected)
+        cases = [
+            (False, False, [mocked_file_name]),
+            (False, True, [mocked_file_name]),
+            (True, False, []),
+            (True, True, [mocked_file_name]),
+        ]
+        for only_existing, file_exists, expected in cases:
+            with self.subTest(only_existing=only_existing, file_exists=file_exists):
+                if file_exists:
+                    with open(mocked_file_name, "w") as file:
+                        file.write("# Mocked content\n" + self.LEGACY_LINE_NL)
+                elif os.path.exists(mocked_file_name):
+                    os.remove(mocked_file_name)
+                result = core_setup.generate_scripts_dir_list(file_name=self.USER_SETUP, only_existing=only_existing)
+                self.assertEqual(expected, result)
+                for path in result:
+                    self.assertEqual(file_exists, os.path.exists(path))
 
     @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_add_entry_line_missing(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
+    def test_add_entry_line(self, mock_get_preferences):
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
+        os.makedirs(mocked_scripts_dir, exist_ok=True)
         mock_get_preferences.return_value = {"2020": test_temp_dir}
-        logging.disable(logging.WARNING)
-        core_setup.add_entry_line(file_path=mocked_file_name, create_missing_file=False)
-        logging.disable(logging.NOTSET)
-        expected = False
-        result = os.path.exists(mocked_file_name)
-        self.assertEqual(expected, result)
-
-    def test_remove_entry_line_basic(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(f"{core_setup.PACKAGE_ENTRY_LINE}\n")
-        expected = [f"{core_setup.PACKAGE_ENTRY_LINE}\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-        core_setup.remove_entry_line(
-            file_path=mocked_file_name, line_to_remove=core_setup.PACKAGE_ENTRY_LINE, delete_empty_file=False
-        )
-        expected = []
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-
-    def test_remove_entry_line_times_removed(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(f"{core_setup.PACKAGE_ENTRY_LINE}\n" * 5)
-        result = core_setup.remove_entry_line(
-            file_path=mocked_file_name, line_to_remove=core_setup.PACKAGE_ENTRY_LINE, delete_empty_file=False
-        )
-        expected = 5
-        self.assertEqual(expected, result)
-
-    def test_remove_entry_line_times_removed_zero(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w"):
-            pass
-        result = core_setup.remove_entry_line(
-            file_path=mocked_file_name, line_to_remove=core_setup.PACKAGE_ENTRY_LINE, delete_empty_file=False
-        )
-        expected = 0
-        self.assertEqual(expected, result)
-
-    def test_remove_entry_line_delete_empty(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(core_setup.PACKAGE_ENTRY_LINE + "\n")
-        expected = [core_setup.PACKAGE_ENTRY_LINE + "\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-        core_setup.remove_entry_line(
-            file_path=mocked_file_name, line_to_remove=core_setup.PACKAGE_ENTRY_LINE, delete_empty_file=True
-        )
-        expected = False
-        result = os.path.exists(mocked_file_name)
-        self.assertEqual(expected, result)
-
-    def test_remove_entry_line_delete_non_empty(self):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_ENTRY_LINE}\n")
-        result = core_setup.remove_entry_line(
-            file_path=mocked_file_name, line_to_remove=core_setup.PACKAGE_ENTRY_LINE, delete_empty_file=True
-        )
-        expected = 1
-        self.assertEqual(expected, result)
-        expected = True
-        result = os.path.exists(mocked_file_name)
-        self.assertEqual(expected, result)
+        # (initial_content, create_missing_file, expected) - "None" content means missing file
+        cases = [
+            ("", False, [self.ENTRY_LINE_NL]),
+            (None, True, [self.ENTRY_LINE_NL]),
+            ("# Mocked content", True, ["# Mocked content\n", self.ENTRY_LINE_NL]),
+            (None, False, None),
+        ]
+        for initial_content, create_missing_file, expected in cases:
+            with self.subTest(initial_content=initial_content, create_missing_file=create_missing_file):
+                if initial_content is not None:
+                    with open(mocked_file_name, "w") as file:
+                        file.write(initial_content)
+                elif os.path.exists(mocked_file_name):
+                    os.remove(mocked_file_name)
+                logging.disable(logging.WARNING)
+                core_setup.add_entry_line(file_path=mocked_file_name, create_missing_file=create_missing_file)
+                logging.disable(logging.NOTSET)
+                if expected is None:
+                    self.assertEqual(False, os.path.exists(mocked_file_name))
+                    continue
+                result = pathlib.Path(mocked_file_name).read_text().splitlines(keepends=True)
+                self.assertEqual(expected, result)
+
+    def test_remove_entry_line(self):
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
+        os.makedirs(mocked_scripts_dir, exist_ok=True)
+        # (initial_content, delete_empty_file, expected_removed, expected_lines) - "None" lines means deleted file
+        cases = [
+            (self.ENTRY_LINE_NL, False, 1, []),
+            (self.ENTRY_LINE_NL * 5, False, 5, []),
+            ("", False, 0, []),
+            (self.ENTRY_LINE_NL, True, 1, None),
+            ("# Mocked content\n" + self.ENTRY_LINE_NL, True, 1, ["# Mocked content\n"]),
+        ]
+        for initial_content, delete_empty_file, expected_removed, expected_lines in cases:
+            with self.subTest(initial_content=initial_content, delete_empty_file=delete_empty_file):
+                with open(mocked_file_name, "w") as file:
+                    file.write(initial_content)
+                result = core_setup.remove_entry_line(
+                    file_path=mocked_file_name,
+                    line_to_remove=self.ENTRY_LINE,
+                    delete_empty_file=delete_empty_file,
+                )
+                self.assertEqual(expected_removed, result)
+                if expected_lines is None:
+                    self.assertEqual(False, os.path.exists(mocked_file_name))
+                    continue
+                result = pathlib.Path(mocked_file_name).read_text().splitlines(keepends=True)
+                self.assertEqual(expected_lines, result)
 
     @patch("gt.core.setup.generate_user_setup_list")
     def test_add_entry_point_to_maya_installs(self, mock_user_setup_list):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
         mock_user_setup_list.return_value = [mocked_file_name]
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
         with open(mocked_file_name, "w") as file:
             file.write("# Mocked content\n")
         core_setup.add_entry_point_to_maya_installs()
-        expected = ["# Mocked content\n", f"{core_setup.PACKAGE_ENTRY_LINE}\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
+        expected = ["# Mocked content\n", self.ENTRY_LINE_NL]
+        result = pathlib.Path(mocked_file_name).read_text().splitlines(keepends=True)
         self.assertEqual(expected, result)
 
     @patch("gt.core.setup.generate_user_setup_list")
     def test_remove_entry_point_from_maya_installs(self, mock_user_setup_list):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
         mock_user_setup_list.return_value = [mocked_file_name]
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
         with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_ENTRY_LINE}\n")
+            file.write("# Mocked content\n" + self.ENTRY_LINE_NL)
         core_setup.remove_entry_point_from_maya_installs()
         expected = ["# Mocked content\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
+        result = pathlib.Path(mocked_file_name).read_text().splitlines(keepends=True)
         self.assertEqual(expected, result)
 
     @patch("gt.core.setup.generate_user_setup_list")
     def test_remove_legacy_entry_point_from_maya_installs(self, mock_user_setup_list):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
         mock_user_setup_list.return_value = [mocked_file_name]
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
         with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_LEGACY_LINE}\n")
+            file.write("# Mocked content\n" + self.LEGACY_LINE_NL)
         core_setup.remove_legacy_entry_point_from_maya_installs(verbose=False)
         expected = ["# Mocked content\n"]
-        with open(mocked_file_name) as file:
-            result = file.readlines()
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_return(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_LEGACY_LINE}\n")
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=True)
-        expected = [mocked_file_name]
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_exists(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_LEGACY_LINE}\n")
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=True)
-        expected = True
-        if result:
-            result = os.path.exists(result[0])
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_generate_scripts_dir_list_non_existing(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        if not os.path.exists(mocked_scripts_dir):
-            os.mkdir(mocked_scripts_dir)
-        mock_get_preferences.return_value = {"2020": test_temp_dir}
-        result = core_setup.generate_scripts_dir_list(file_name=core_setup.PACKAGE_USER_SETUP, only_existing=True)
-        expected = []
+        result = pathlib.Path(mocked_file_name).read_text().splitlines(keepends=True)
         self.assertEqual(expected, result)
 
     @patch("gt.core.setup.get_available_maya_preferences_dirs")
     def test_generate_user_setup_list_return(self, mock_get_preferences):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, core_setup.PACKAGE_USER_SETUP)
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}{self.USER_SETUP}"
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
         with open(mocked_file_name, "w") as file:
-            file.write(f"# Mocked content\n{core_setup.PACKAGE_LEGACY_LINE}\n")
+            file.write("# Mocked content\n" + self.LEGACY_LINE_NL)
         mock_get_preferences.return_value = {"2020": test_temp_dir}
         result = core_setup.generate_user_setup_list(only_existing=True)
         expected = [mocked_file_name]
@@ -456,9 +319,9 @@ class TestSetupCore(unittest.TestCase):
 
     @patch("gt.core.setup.generate_scripts_dir_list")
     def test_copy_package_loader_to_maya_installs(self, mock_scripts_dir_list):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, "package_loader.py")
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}package_loader.py"
         mock_scripts_dir_list.return_value = [mocked_file_name]
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
@@ -469,9 +332,9 @@ class TestSetupCore(unittest.TestCase):
 
     @patch("gt.core.setup.generate_scripts_dir_list")
     def test_remove_package_loader_from_maya_installs(self, mock_scripts_dir_list):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_scripts_dir = os.path.join(test_temp_dir, "scripts")
-        mocked_file_name = os.path.join(mocked_scripts_dir, "package_loader.py")
+        test_temp_dir = self.temp_dir
+        mocked_scripts_dir = f"{test_temp_dir}{SEP}scripts"
+        mocked_file_name = f"{mocked_scripts_dir}{SEP}package_loader.py"
         mock_scripts_dir_list.return_value = [mocked_file_name]
         if not os.path.exists(mocked_scripts_dir):
             os.mkdir(mocked_scripts_dir)
@@ -482,83 +345,6 @@ class TestSetupCore(unittest.TestCase):
         result = os.path.exists(mocked_file_name)
         self.assertEqual(expected, result)
 
-    @patch("gt.core.setup.get_available_maya_preferences_dirs")
-    def test_is_legacy_version_install_present(self, mocked_maya_preferences_dirs):
-        mocked_maya_preferences_dirs.return_value = {}
-        result = core_setup.is_legacy_version_install_present()
-        expected = False
-        self.assertEqual(expected, result)
-
-    @patch("gt.core.setup.check_installation_integrity")
-    @patch("gt.core.setup.remove_legacy_entry_point_from_maya_installs")
-    @patch("gt.core.setup.copy_package_loader_to_maya_installs")
-    @patch("gt.core.setup.add_entry_point_to_maya_installs")
-    @patch("gt.core.setup.remove_previous_install")
-    @patch("gt.core.setup.get_package_requirements")
-    @patch("gt.core.setup.get_maya_preferences_dir")
-    @patch("gt.core.setup.is_script_in_py_maya")
-    def test_install_package_basic_calls(
-        self,
-        mock_is_script_in_py,
-        mock_preferences_dir,
-        mock_get_package_requirements,
-        mock_remove_previous_install,
-        mock_add_entry_point,
-        mock_copy_package_loader,
-        mock_remove_legacy_entry_point,
-        mock_installation_integrity,
-    ):
-        maya_test_tools.mel.eval('$gMainWindow = "";')  # To avoid unnecessary UI error
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_target_dir = os.path.join(test_temp_dir, core_setup.PACKAGE_NAME)
-        mocked_requirement_dir = os.path.join(test_temp_dir, "tools")
-        if not os.path.exists(mocked_requirement_dir):
-            os.mkdir(mocked_requirement_dir)
-        mock_is_script_in_py.return_value = False  # Maya Standalone already initialized (True initializes it)
-        mock_preferences_dir.return_value = test_temp_dir
-        mock_get_package_requirements.return_value = {"tools": mocked_requirement_dir}
-        result = core_setup.install_package(clean_install=True, verbose=False)
-        mock_is_script_in_py.assert_called()
-        mock_preferences_dir.assert_called()
-        mock_get_package_requirements.assert_called_once()
-        mock_remove_previous_install.assert_called_once()
-        mock_add_entry_point.assert_called_once()
-        mock_copy_package_loader.assert_called_once()
-        mock_remove_legacy_entry_point.assert_called_once()
-        mock_installation_integrity.assert_called_once()
-        expected = True  # Ended with return True - Reached integrity check
-        self.assertEqual(expected, result)
-        expected = "tools"
-        result = os.listdir(mocked_target_dir)
-        self.assertIn(expected, result)
-
-    @patch("gt.core.setup.remove_package_loader_from_maya_installs")
-    @patch("gt.core.setup.remove_entry_point_from_maya_installs")
-    @patch("gt.core.setup.get_maya_preferences_dir")
-    @patch("gt.core.setup.is_script_in_py_maya")
-    def test_uninstall_package_basic_calls(
-        self, mock_is_script_in_py, mock_preferences_dir, mock_remove_entry_point, mock_remove_package_loader
-    ):
-        test_temp_dir = maya_test_tools.generate_test_temp_dir()
-        mocked_target_dir = os.path.join(test_temp_dir, core_setup.PACKAGE_NAME)
-        mocked_requirement_dir = os.path.join(test_temp_dir, "tools")
-        if not os.path.exists(mocked_requirement_dir):
-            os.mkdir(mocked_requirement_dir)
-        if not os.path.exists(mocked_target_dir):
-            os.mkdir(mocked_target_dir)
-        mock_is_script_in_py.return_value = False  # Maya Standalone already initialized (True initializes it)
-        mock_preferences_dir.return_value = test_temp_dir
-        result = core_setup.uninstall_package(verbose=False)
-        mock_is_script_in_py.assert_called()
-        mock_preferences_dir.assert_called()
-        mock_remove_entry_point.assert_called_once()
-        mock_remove_package_loader.assert_called_once()
-        expected = True  # Ended with return True reached end of function
-        self.assertEqual(expected, result)
-        expected = False
-        result = os.path.exists(mocked_target_dir)
-        self.assertEqual(expected, result)
-
     @patch("gt.core.setup.get_maya_preferences_dir")
     def test_get_installed_module_path(self, mocked_get_prefs):
         mocked_get_prefs.return_value = "mocked_path"
@@ -578,7 +364,8 @@ class TestSetupCore(unittest.TestCase):
         mock_get_installed_core_module_path.return_value = "/path/to/installed/core/module"
         remove_paths = ["/some/old/path"]
 
-        initial_sys_path = sys.path.copy()
+        # Restore "sys.path" in place even if an assertion fails (keeps the test hermetic)
+        self.addCleanup(sys.path.__init__, sys.path.copy())
         sys.path.insert(0, remove_paths[0])
         result = core_setup.prepend_sys_path_with_default_install_location(remove_paths)
 
@@ -586,5 +373,123 @@ class TestSetupCore(unittest.TestCase):
         self.assertIn("/path/to/installed/core/module", sys.path)
         self.assertNotIn("/some/old/path", sys.path)
 
-        # Clean up sys.path modifications
-        sys.path = initial_sys_path
+
+class TestSetupCoreMaya(unittest.TestCase):
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.temp_dir = self.temp_dir_obj.name
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+        _import_modules_under_test()
+        cls.NAME = core_setup.PACKAGE_NAME
+
+    def tearDown(self):
+        self.temp_dir_obj.cleanup()
+
+    def test_get_maya_settings_dir_exists(self):
+        settings_dir = core_setup.get_maya_preferences_dir()
+        result = os.path.exists(settings_dir)
+        expected = True
+        self.assertEqual(expected, result)
+
+    def test_get_maya_settings_dir_is_folder(self):
+        settings_dir = core_setup.get_maya_preferences_dir()
+        result = os.path.isdir(settings_dir)
+        expected = True
+        self.assertEqual(expected, result)
+
+    @patch("maya.cmds.about")
+    def test_get_maya_settings_dir_about_key(self, mock_about):
+        mock_about.return_value = "mocked_path"
+        core_setup.get_maya_preferences_dir()
+        result = str(mock_about.call_args)
+        expected = "call(preferences=True)"
+        self.assertEqual(expected, result)
+
+    @patch("gt.core.setup.get_available_maya_preferences_dirs")
+    def test_is_legacy_version_install_present(self, mocked_maya_preferences_dirs):
+        mocked_maya_preferences_dirs.return_value = {}
+        result = core_setup.is_legacy_version_install_present()
+        expected = False
+        self.assertEqual(expected, result)
+
+    def test_install_package_basic_calls(self):
+        maya_test_tools.mel.eval('$gMainWindow = "";')  # To avoid unnecessary UI error
+        test_temp_dir = self.temp_dir
+        mocked_target_dir = os.path.join(test_temp_dir, self.NAME)
+        mocked_requirement_dir = os.path.join(test_temp_dir, "tools")
+        os.makedirs(mocked_requirement_dir, exist_ok=True)
+        with patch.multiple(
+            "gt.core.setup",
+            is_script_in_py_maya=DEFAULT,
+            get_maya_preferences_dir=DEFAULT,
+            get_package_requirements=DEFAULT,
+            remove_previous_install=DEFAULT,
+            add_entry_point_to_maya_installs=DEFAULT,
+            copy_package_loader_to_maya_installs=DEFAULT,
+            remove_legacy_entry_point_from_maya_installs=DEFAULT,
+            check_installation_integrity=DEFAULT,
+        ) as mocks:
+            mocks["is_script_in_py_maya"].return_value = False  # Standalone already initialized (True initializes it)
+            mocks["get_maya_preferences_dir"].return_value = test_temp_dir
+            mocks["get_package_requirements"].return_value = {"tools": mocked_requirement_dir}
+            mocks["remove_legacy_entry_point_from_maya_installs"].return_value = False
+            mocks["check_installation_integrity"].return_value = True
+            manager = MagicMock()  # Records the calls of all mocks in order
+            for name, mock in mocks.items():
+                manager.attach_mock(mock, name)
+            result = core_setup.install_package(clean_install=True, verbose=False)
+        package_target_folder = os.path.normpath(mocked_target_dir)
+        expected = [
+            call.is_script_in_py_maya(),
+            call.get_maya_preferences_dir(),
+            call.get_package_requirements(),
+            call.remove_previous_install(package_target_folder),
+            call.add_entry_point_to_maya_installs(),
+            call.copy_package_loader_to_maya_installs(),
+            call.remove_legacy_entry_point_from_maya_installs(verbose=False),
+            call.check_installation_integrity(package_target_folder),
+            call.is_script_in_py_maya(),
+            call.get_maya_preferences_dir(),  # Prepending "sys.path" with installed module
+        ]
+        self.assertEqual(expected, manager.mock_calls)
+        expected = True  # Ended with return True - Reached integrity check
+        self.assertEqual(expected, result)
+        expected = "tools"
+        result = os.listdir(mocked_target_dir)
+        self.assertIn(expected, result)
+
+    def test_uninstall_package_basic_calls(self):
+        test_temp_dir = self.temp_dir
+        mocked_target_dir = os.path.join(test_temp_dir, self.NAME)
+        mocked_requirement_dir = os.path.join(test_temp_dir, "tools")
+        for path in [mocked_requirement_dir, mocked_target_dir]:
+            os.makedirs(path, exist_ok=True)
+        with patch.multiple(
+            "gt.core.setup",
+            is_script_in_py_maya=DEFAULT,
+            get_maya_preferences_dir=DEFAULT,
+            remove_entry_point_from_maya_installs=DEFAULT,
+            remove_package_loader_from_maya_installs=DEFAULT,
+        ) as mocks:
+            mocks["is_script_in_py_maya"].return_value = False  # Standalone already initialized (True initializes it)
+            mocks["get_maya_preferences_dir"].return_value = test_temp_dir
+            manager = MagicMock()  # Records the calls of all mocks in order
+            for name, mock in mocks.items():
+                manager.attach_mock(mock, name)
+            result = core_setup.uninstall_package(verbose=False)
+        expected = [
+            call.is_script_in_py_maya(),
+            call.get_maya_preferences_dir(),
+            call.remove_entry_point_from_maya_installs(),
+            call.remove_package_loader_from_maya_installs(),
+        ]
+        self.assertEqual(expected, manager.mock_calls)
+        expected = True  # Ended with return True reached end of function
+        self.assertEqual(expected, result)
+        expected = False
+        result = os.path.exists(mocked_target_dir)
+        self.assertEqual(expected, result)
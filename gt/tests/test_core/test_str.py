@@ -6,7 +6,7 @@ import unittest
 # Logging Setup
 logging.basicConfig()
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.WARNING)
 
 # Import Utility
 tools_root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -16,62 +16,76 @@ import gt.core.str as core_str
 
 
 class TestStringCore(unittest.TestCase):
+    CAMEL_STRING = "oneTwoThree"
+    SNAKE_STRING = "one_two_three"
+    CAMEL_WORDS = ("one", "Two", "Three")
+
     def test_remove_string_prefix(self):
-        string_to_test = "oneTwoThree"
+        string_to_test = self.CAMEL_STRING
         expected = "TwoThree"
         result = core_str.remove_prefix(input_string=string_to_test, prefix="one")
         self.assertEqual(expected, result)
 
     def test_remove_string_prefix_no_change(self):
-        string_to_test = "oneTwoThree"
+        string_to_test = self.CAMEL_STRING
         expected = string_to_test
         result = core_str.remove_prefix(input_string=string_to_test, prefix="Two")
         self.assertEqual(expected, result)
 
     def test_remove_string_suffix(self):
-        string_to_test = "oneTwoThree"
+        string_to_test = self.CAMEL_STRING
         expected = "oneTwo"
         result = core_str.remove_suffix(input_string=string_to_test, suffix="Three")
         self.assertEqual(expected, result)
 
     def test_remove_string_suffix_no_change(self):
-        string_to_test = "oneTwoThree"
+        string_to_test = self.CAMEL_STRING
         expected = string_to_test
         result = core_str.remove_suffix(input_string=string_to_test, suffix="Two")
         self.assertEqual(expected, result)
 
     def test_camel_case_to_snake_case(self):
-        string_to_test = "oneTwoThree"
-        expected = "one_two_three"
+        string_to_test = self.CAMEL_STRING
+        expected = self.SNAKE_STRING
         result = core_str.camel_to_snake(camel_case_string=string_to_test)
         self.assertEqual(expected, result)
 
     def test_camel_case_to_snake_case_no_change(self):
-        string_to_test = "one_two_three"
+        string_to_test = self.SNAKE_STRING
         expected = string_to_test
         result = core_str.camel_to_snake(camel_case_string=string_to_test)
         self.assertEqual(expected, result)
 
+    def test_camel_to_snake_cached(self):
+        core_str.clear_case_conversion_caches()
+        core_str.camel_to_snake(camel_case_string=self.CAMEL_STRING)
+        result = core_str.camel_to_snake(camel_case_string=self.CAMEL_STRING)
+        expected = self.SNAKE_STRING
+        self.assertEqual(expected, result)
+        self.assertEqual(1, core_str.camel_to_snake.cache_info().hits)
+        core_str.clear_case_conversion_caches()
+        self.assertEqual(0, core_str.camel_to_snake.cache_info().currsize)
+
     def test_camel_case_split(self):
-        string_to_test = "oneTwoThree"
-        expected = ["one", "Two", "Three"]
+        string_to_test = self.CAMEL_STRING
+        expected = list(self.CAMEL_WORDS)
         result = core_str.camel_case_split(input_string=string_to_test)
         self.assertEqual(expected, result)
 
     def test_string_list_to_snake_case(self):
-        string_list = ["one", "Two", "Three"]
-        expected = "one_two_three"
+        string_list = list(self.CAMEL_WORDS)
+        expected = self.SNAKE_STRING
         result = core_str.string_list_to_snake_case(string_list=string_list)
         self.assertEqual(expected, result)
 
     def test_string_list_to_snake_case_separating_string(self):
-        string_list = ["one", "Two", "Three"]
+        string_list = list(self.CAMEL_WORDS)
         expected = "one-two-three"
         result = core_str.string_list_to_snake_case(string_list=string_list, separating_string="-")
         self.assertEqual(expected, result)
 
     def test_string_list_to_snake_case_force_lowercase(self):
-        string_list = ["one", "Two", "Three"]
+        string_list = list(self.CAMEL_WORDS)
         expected = "one_Two_Three"
         result = core_str.string_list_to_snake_case(string_list=string_list, force_lowercase=False)
         self.assertEqual(expected, result)
@@ -312,132 +326,67 @@ class TestStringCore(unittest.TestCase):
                 self.assertEqual(expected, result)
 
     def test_get_int_as_rank_21st_to_100th(self):
+        suffix_dict = {1: "st", 2: "nd", 3: "rd"}
         for i in range(21, 101):
             with self.subTest(i=i):
                 last_digit = i % 10
-                suffix_dict = {1: "st", 2: "nd", 3: "rd"}
                 expected_suffix = suffix_dict.get(last_digit, "th")
                 expected = f"{i}{expected_suffix}"
                 result = core_str.get_int_as_rank(i)
                 self.assertEqual(expected, result)
 
-    def test_get_int_to_en_zero(self):
-        expected = "zero"
-        result = core_str.get_int_as_en(0)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_single_digit(self):
-        expected = "five"
-        result = core_str.get_int_as_en(5)
-        self.assertEqual(expected, result)
-
-        expected = "nine"
-        result = core_str.get_int_as_en(9)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_double_digit(self):
-        expected = "ten"
-        result = core_str.get_int_as_en(10)
-        self.assertEqual(expected, result)
-
-        expected = "twenty-one"
-        result = core_str.get_int_as_en(21)
-        self.assertEqual(expected, result)
-
-        expected = "ninety-nine"
-        result = core_str.get_int_as_en(99)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_hundreds(self):
-        expected = "one hundred"
-        result = core_str.get_int_as_en(100)
-        self.assertEqual(expected, result)
-
-        expected = "one hundred and twenty-three"
-        result = core_str.get_int_as_en(123)
-        self.assertEqual(expected, result)
-
-        expected = "nine hundred and ninety-nine"
-        result = core_str.get_int_as_en(999)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_thousands(self):
-        expected = "one thousand"
-        result = core_str.get_int_as_en(1000)
-        self.assertEqual(expected, result)
-
-        expected = "two thousand, three hundred and forty-five"
-        result = core_str.get_int_as_en(2345)
-        self.assertEqual(expected, result)
-
-        expected = "nine thousand, nine hundred and ninety-nine"
-        result = core_str.get_int_as_en(9999)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_millions(self):
-        expected = "one million"
-        result = core_str.get_int_as_en(1000000)
-        self.assertEqual(expected, result)
-
-        expected = "one million, two hundred and thirty-four thousand, " "five hundred and sixty-seven"
-        result = core_str.get_int_as_en(1234567)
-        self.assertEqual(expected, result)
-
-        expected = "nine million, nine hundred and ninety-nine thousand, " "nine hundred and ninety-nine"
-        result = core_str.get_int_as_en(9999999)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_billions(self):
-        expected = "one billion"
-        result = core_str.get_int_as_en(1000000000)
-        self.assertEqual(expected, result)
-
-        expected = (
-            "one billion, two hundred and thirty-four million, "
-            "five hundred and sixty-seven thousand, eight hundred and ninety"
+    def test_get_int_to_en(self):
+        cases = (
+            (0, "zero"),
+            (5, "five"),
+            (9, "nine"),
+            (10, "ten"),
+            (21, "twenty-one"),
+            (99, "ninety-nine"),
+            (100, "one hundred"),
+            (123, "one hundred and twenty-three"),
+            (999, "nine hundred and ninety-nine"),
+            (1000, "one thousand"),
+            (2345, "two thousand, three hundred and forty-five"),
+            (9999, "nine thousand, nine hundred and ninety-nine"),
+            (1000000, "one million"),
+            (1234567, "one million, two hundred and thirty-four thousand, five hundred and sixty-seven"),
+            (9999999, "nine million, nine hundred and ninety-nine thousand, nine hundred and ninety-nine"),
+            (1000000000, "one billion"),
+            (
+                1234567890,
+                "one billion, two hundred and thirty-four million, "
+                "five hundred and sixty-seven thousand, eight hundred and ninety",
+            ),
+            (
+                9999999999,
+                "nine billion, nine hundred and ninety-nine million, "
+                "nine hundred and ninety-nine thousand, nine hundred and ninety-nine",
+            ),
+            (1000000000000, "one trillion"),
+            (
+                1234567890123,
+                "one trillion, two hundred and thirty-four billion, "
+                "five hundred and sixty-seven million, eight hundred and ninety thousand, "
+                "one hundred and twenty-three",
+            ),
+            (
+                9999999999999,
+                "nine trillion, nine hundred and ninety-nine billion, "
+                "nine hundred and ninety-nine million, nine hundred and ninety-nine thousand, "
+                "nine hundred and ninety-nine",
+            ),
+            (-5, "negative five"),
+            (
+                -987654321,
+                "negative nine hundred and eighty-seven million, "
+                "six hundred and fifty-four thousand, three hundred and twenty-one",
+            ),
         )
-        result = core_str.get_int_as_en(1234567890)
-        self.assertEqual(expected, result)
-
-        expected = (
-            "nine billion, nine hundred and ninety-nine million, "
-            "nine hundred and ninety-nine thousand, nine hundred and ninety-nine"
-        )
-        result = core_str.get_int_as_en(9999999999)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_positive_trillions(self):
-        expected = "one trillion"
-        result = core_str.get_int_as_en(1000000000000)
-        self.assertEqual(expected, result)
-
-        expected = (
-            "one trillion, two hundred and thirty-four billion, "
-            "five hundred and sixty-seven million, eight hundred and ninety thousand, "
-            "one hundred and twenty-three"
-        )
-        result = core_str.get_int_as_en(1234567890123)
-        self.assertEqual(expected, result)
-
-        expected = (
-            "nine trillion, nine hundred and ninety-nine billion, "
-            "nine hundred and ninety-nine million, nine hundred and ninety-nine thousand, "
-            "nine hundred and ninety-nine"
-        )
-        result = core_str.get_int_as_en(9999999999999)
-        self.assertEqual(expected, result)
-
-    def test_get_int_to_en_negative_numbers(self):
-        expected = "negative five"
-        result = core_str.get_int_as_en(-5)
-        self.assertEqual(expected, result)
-
-        expected = (
-            "negative nine hundred and eighty-seven million, "
-            "six hundred and fifty-four thousand, three hundred and twenty-one"
-        )
-        result = core_str.get_int_as_en(-987654321)
-        self.assertEqual(expected, result)
+        for number, expected in cases:
+            with self.subTest(number=number):
+                result = core_str.get_int_as_en(number)
+                self.assertEqual(expected, result)
 
     def test_get_int_to_en_non_integer_input(self):
         with self.assertRaises(AssertionError):
@@ -494,46 +443,49 @@ class TestStringCore(unittest.TestCase):
         result = core_str.camel_to_title("CAMELCASESTRING")
         self.assertEqual(expected, result)
 
-    def test_filter_strings_by_prefix_case_sensitive(self):
-        strings = ["apple", "banana", "cherry"]
-        prefixes = ["a", "b"]
-        result = core_str.filter_strings_by_prefix(strings, prefixes, case_sensitive=True)
-        expected = ["apple", "banana"]
-        self.assertEqual(expected, result)
-
-    def test_filter_strings_by_prefix_case_insensitive(self):
-        strings = ["Apple", "banana", "Cherry"]
-        prefixes = ["a", "b"]
-        result = core_str.filter_strings_by_prefix(strings, prefixes, case_sensitive=False)
-        expected = ["Apple", "banana"]
-        self.assertEqual(expected, result)
-
-    def test_filter_strings_by_suffix_case_sensitive(self):
-        strings = ["applepie", "banana", "cherry"]
-        suffixes = ["pie", "na"]
-        result = core_str.filter_strings_by_suffix(strings, suffixes, case_sensitive=True)
-        expected = ["applepie", "banana"]
-        self.assertEqual(expected, result)
-
-    def test_filter_strings_by_suffix_case_insensitive(self):
-        strings = ["ApplePie", "Banana", "Cherry"]
-        suffixes = ["pie", "na"]
-        result = core_str.filter_strings_by_suffix(strings, suffixes, case_sensitive=False)
-        expected = ["ApplePie", "Banana"]
-        self.assertEqual(expected, result)
+    def test_filter_strings(self):
+        cases = (
+            (core_str.filter_strings_by_prefix, ["apple", "banana", "cherry"], ["a", "b"], True, ["apple", "banana"]),
+            (core_str.filter_strings_by_prefix, ["Apple", "banana", "Cherry"], ["a", "b"], False, ["Apple", "banana"]),
+            (
+                core_str.filter_strings_by_suffix,
+                ["applepie", "banana", "cherry"],
+                ["pie", "na"],
+                True,
+                ["applepie", "banana"],
+            ),
+            (
+                core_str.filter_strings_by_suffix,
+                ["ApplePie", "Banana", "Cherry"],
+                ["pie", "na"],
+                False,
+                ["ApplePie", "Banana"],
+            ),
+            (
+                core_str.filter_strings_containing,
+                ["applepie", "banana", "cherry"],
+                ["pie", "ana"],
+                True,
+                ["applepie", "banana"],
+            ),
+            (
+                core_str.filter_strings_containing,
+                ["ApplePie", "Banana", "Cherry"],
+                ["pie", "na"],
+                False,
+                ["ApplePie", "Banana"],
+            ),
+        )
+        for function, strings, patterns, case_sensitive, expected in cases:
+            with self.subTest(function=function.__name__, case_sensitive=case_sensitive):
+                result = function(strings, patterns, case_sensitive=case_sensitive)
+                self.assertEqual(expected, result)
 
-    def test_filter_strings_containing_case_sensitive(self):
-        strings = ["applepie", "banana", "cherry"]
-        substrings = ["pie", "ana"]
+    def test_filter_strings_containing_special_characters(self):
+        strings = ["joint.tx", "joint_tx", "ctrl*grp"]
+        substrings = [".", "*"]
         result = core_str.filter_strings_containing(strings, substrings, case_sensitive=True)
-        expected = ["applepie", "banana"]
-        self.assertEqual(expected, result)
-
-    def test_filter_strings_containing_case_insensitive(self):
-        strings = ["ApplePie", "Banana", "Cherry"]
-        substrings = ["pie", "na"]
-        result = core_str.filter_strings_containing(strings, substrings, case_sensitive=False)
-        expected = ["ApplePie", "Banana"]
+        expected = ["joint.tx", "ctrl*grp"]
         self.assertEqual(expected, result)
 
     def test_filter_strings_by_prefix_single_string_input(self):
@@ -613,6 +565,15 @@ class TestStringCore(unittest.TestCase):
         result = core_str.replace_keys_with_values(input_string, replacements_dict, case_sensitive=True)
         self.assertEqual(expected, result)
 
+    def test_core_string_replace_keys_with_values_single_pass(self):
+        input_string = "ab"
+        replacements_dict = {"a": "b", "b": "c"}
+        expected = "bc"
+        result = core_str.replace_keys_with_values(input_string, replacements_dict, case_sensitive=True)
+        self.assertEqual(expected, result)
+        result = core_str.replace_keys_with_values(input_string.upper(), replacements_dict, case_sensitive=False)
+        self.assertEqual(expected, result)
+
     def test_core_string_replace_keys_with_values_invalid_input_string(self):
         input_string = 12345
         replacements_dict = {"12345": "test"}
@@ -625,50 +586,18 @@ class TestStringCore(unittest.TestCase):
         with self.assertRaises(ValueError):
             core_str.replace_keys_with_values(input_string, replacements_dict, case_sensitive=True)
 
-    def test_snake_to_title_basic(self):
-        input_string = "hello_world"
-        expected_output = "Hello World"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_single_word(self):
-        input_string = "hello"
-        expected_output = "Hello"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_empty_string(self):
-        input_string = ""
-        expected_output = ""
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_multiple_underscores(self):
-        input_string = "this_is_a_test_string"
-        expected_output = "This Is A Test String"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_leading_trailing_underscores(self):
-        input_string = "_leading_and_trailing_"
-        expected_output = " Leading And Trailing "
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_consecutive_underscores(self):
-        input_string = "consecutive__underscores"
-        expected_output = "Consecutive  Underscores"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_numbers(self):
-        input_string = "number_123_case"
-        expected_output = "Number 123 Case"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
-
-    def test_snake_to_title_special_characters(self):
-        input_string = "special_characters_!@#"
-        expected_output = "Special Characters !@#"
-        result = core_str.snake_to_title(input_string)
-        self.assertEqual(expected_output, result)
+    def test_snake_to_title(self):
+        cases = (
+            ("hello_world", "Hello World"),
+            ("hello", "Hello"),
+            ("", ""),
+            ("this_is_a_test_string", "This Is A Test String"),
+            ("_leading_and_trailing_", " Leading And Trailing "),
+            ("consecutive__underscores", "Consecutive  Underscores"),
+            ("number_123_case", "Number 123 Case"),
+            ("special_characters_!@#", "Special Characters !@#"),
+        )
+        for input_string, expected_output in cases:
+            with self.subTest(input_string=input_string):
+                result = core_str.snake_to_title(input_string)
+                self.assertEqual(expected_output, result)
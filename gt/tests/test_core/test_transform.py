@@ -20,52 +20,40 @@ for to_append in [package_root_dir, tests_dir]:
 from gt.tests import maya_test_tools
 from gt.core import transform as core_transform
 cmds = maya_test_tools.cmds
+om = maya_test_tools.om
 
+# Points of the straight curve used by the shape tests (one point per CV)
+CURVE_POINTS = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
+                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
 
-class TestTransformCore(unittest.TestCase):
-    def setUp(self):
-        maya_test_tools.force_new_scene()
-        self.vector_a = core_transform.Vector3(1, 2, 3)
-        self.vector_b = core_transform.Vector3(4, 5, 6)
 
-    @classmethod
-    def setUpClass(cls):
-        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+def create_test_curve():
+    """
+    Creates the degree 3 curve used by the shape tests out of "CURVE_POINTS".
 
-    def assertAlmostEqualSigFig(self, arg1, arg2, tolerance=2):
-        """
-        Asserts that two numbers are almost equal up to a given number of significant figures.
-
-        Args:
-            self (object): The current test case or class object.
-            arg1 (float): The first number for comparison.
-            arg2 (float): The second number for comparison.
-            tolerance (int, optional): The number of significant figures to consider for comparison. Default is 2.
-
-        Returns:
-            None
+    Returns:
+        str: Name of the created curve transform.
+    """
+    return cmds.curve(point=CURVE_POINTS, degree=3, name='mocked_curve')
 
-        Raises:
-            AssertionError: If the significands of arg1 and arg2 differ by more than the specified tolerance.
 
-        Example:
-            obj = TestClass()
-            obj.assertAlmostEqualSigFig(3.145, 3.14159, tolerance=3)
-            # No assertion error will be raised as the first 3 significant figures are equal (3.14)
-        """
-        if tolerance > 1:
-            tolerance = tolerance - 1
+def get_cv_positions(curve):
+    """
+    Gets the world space position of every CV in a curve using a single API call.
 
-        str_formatter = '{0:.' + str(tolerance) + 'e}'
-        significand_1 = float(str_formatter.format(arg1).split('e')[0])
-        significand_2 = float(str_formatter.format(arg2).split('e')[0])
+    Args:
+        curve (str): Name of the curve transform.
 
-        exponent_1 = int(str_formatter.format(arg1).split('e')[1])
-        exponent_2 = int(str_formatter.format(arg2).split('e')[1])
+    Returns:
+        list: A list of [x, y, z] lists, one per CV.
+    """
+    selection = om.MSelectionList()
+    selection.add(curve)
+    curve_fn = om.MFnNurbsCurve(selection.getDagPath(0))
+    return [[point.x, point.y, point.z] for point in curve_fn.cvPositions(om.MSpace.kWorld)]
 
-        self.assertEqual(significand_1, significand_2)
-        self.assertEqual(exponent_1, exponent_2)
 
+class TestVector3Core(unittest.TestCase):
     # --------------------------------------------- Vector3 Start -------------------------------------------
     def test_vector3_class_as_string(self):
         vector3_object = core_transform.Vector3(x=1.2, y=3.4, z=5.6)
@@ -88,9 +76,9 @@ class TestTransformCore(unittest.TestCase):
 
     def test_vector3_class_equality_false(self):
         vector3_object_a = core_transform.Vector3(x=1.2, y=3.4, z=5.6)
-        vector3_object_b = core_transform.Vector3(x=1.2, y=3.4, z=5.6)
+        vector3_object_b = core_transform.Vector3(x=9.9, y=3.4, z=5.6)
         result = vector3_object_a == vector3_object_b
-        expected = True
+        expected = False
         self.assertEqual(expected, result)
 
     def test_Vector3_init(self):
@@ -225,6 +213,13 @@ class TestTransformCore(unittest.TestCase):
 
     # --------------------------------------------------- Vector3 End -------------------------------------------------
 
+
+class TestTransformClassCore(unittest.TestCase):
+    # Plain tuples, so every test builds its own Vector3 objects (no state shared between tests)
+    VECTOR_A = (1, 2, 3)
+    VECTOR_B = (4, 5, 6)
+    TRS_VALUES = (("position", (1, 2, 3)), ("rotation", (45, 0, 90)), ("scale", (2, 2, 2)))
+
     # ------------------------------------------------- Transform Start -----------------------------------------------
     def test_transform_class_as_string(self):
         vector3_object = core_transform.Vector3(x=1.2, y=3.4, z=5.6)
@@ -290,8 +285,8 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_transform_eq(self):
-        transform_a = core_transform.Transform(self.vector_a, self.vector_a, self.vector_a)
-        transform_b = core_transform.Transform(self.vector_b, self.vector_b, self.vector_b)
+        transform_a = core_transform.Transform(self.VECTOR_A, self.VECTOR_A, self.VECTOR_A)
+        transform_b = core_transform.Transform(self.VECTOR_B, self.VECTOR_B, self.VECTOR_B)
 
         expected = True
         result = transform_a == transform_a
@@ -320,134 +315,73 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(expected, transform.scale)
 
     def test_transform_lt(self):
-        transform_a = core_transform.Transform(self.vector_a, self.vector_a, self.vector_a)
-        transform_b = core_transform.Transform(self.vector_b, self.vector_b, self.vector_b)
+        transform_a = core_transform.Transform(self.VECTOR_A, self.VECTOR_A, self.VECTOR_A)
+        transform_b = core_transform.Transform(self.VECTOR_B, self.VECTOR_B, self.VECTOR_B)
         self.assertTrue(transform_a < transform_b)
         self.assertFalse(transform_b < transform_a)
         self.assertFalse(transform_a < transform_a)
 
     def test_transform_le(self):
-        transform_a = core_transform.Transform(self.vector_a, self.vector_a, self.vector_a)
-        transform_b = core_transform.Transform(self.vector_b, self.vector_b, self.vector_b)
+        transform_a = core_transform.Transform(self.VECTOR_A, self.VECTOR_A, self.VECTOR_A)
+        transform_b = core_transform.Transform(self.VECTOR_B, self.VECTOR_B, self.VECTOR_B)
         self.assertTrue(transform_a <= transform_b)
         self.assertFalse(transform_b <= transform_a)
         self.assertTrue(transform_a <= transform_a)
 
     def test_transform_gt(self):
-        transform_a = core_transform.Transform(self.vector_a, self.vector_a, self.vector_a)
-        transform_b = core_transform.Transform(self.vector_b, self.vector_b, self.vector_b)
+        transform_a = core_transform.Transform(self.VECTOR_A, self.VECTOR_A, self.VECTOR_A)
+        transform_b = core_transform.Transform(self.VECTOR_B, self.VECTOR_B, self.VECTOR_B)
         self.assertFalse(transform_a > transform_b)
         self.assertTrue(transform_b > transform_a)
         self.assertFalse(transform_a > transform_a)
 
     def test_transform_ge(self):
-        transform_a = core_transform.Transform(self.vector_a, self.vector_a, self.vector_a)
-        transform_b = core_transform.Transform(self.vector_b, self.vector_b, self.vector_b)
+        transform_a = core_transform.Transform(self.VECTOR_A, self.VECTOR_A, self.VECTOR_A)
+        transform_b = core_transform.Transform(self.VECTOR_B, self.VECTOR_B, self.VECTOR_B)
         self.assertFalse(transform_a >= transform_b)
         self.assertTrue(transform_b >= transform_a)
         self.assertTrue(transform_a >= transform_a)
 
-    def test_transform_set_position_xyz(self):
-        transform = core_transform.Transform()
-        new_position = core_transform.Vector3(1, 2, 3)
-        transform.set_position(xyz=new_position)
-        self.assertEqual(new_position, transform.position)
-
-    def test_transform_set_rotation_xyz(self):
-        transform = core_transform.Transform()
-        new_rotation = core_transform.Vector3(45, 0, 90)
-        transform.set_rotation(xyz=new_rotation)
-        self.assertEqual(new_rotation, transform.rotation)
-
-    def test_transform_set_scale_xyz(self):
-        transform = core_transform.Transform()
-        new_scale = core_transform.Vector3(2, 2, 2)
-        transform.set_scale(xyz=new_scale)
-        self.assertEqual(new_scale, transform.scale)
-
-    def test_transform_set_position_arg(self):
-        transform = core_transform.Transform()
-        new_position = core_transform.Vector3(1, 2, 3)
-        transform.set_position(1, 2, 3)
-        self.assertEqual(new_position, transform.position)
-
-    def test_transform_set_rotation_arg(self):
-        transform = core_transform.Transform()
-        new_rotation = core_transform.Vector3(45, 0, 90)
-        transform.set_rotation(45, 0, 90)
-        self.assertEqual(new_rotation, transform.rotation)
-
-    def test_transform_set_scale_arg(self):
-        transform = core_transform.Transform()
-        new_scale = core_transform.Vector3(2, 2, 2)
-        transform.set_scale(2, 2, 2)
-        self.assertEqual(new_scale, transform.scale)
-
-    def test_transform_set_position_fewer_channels(self):
-        transform = core_transform.Transform()
-        new_position = core_transform.Vector3(1, 2, 3)
-        transform.set_position(xyz=new_position.get_as_tuple())
-        transform.set_position(x=10)
-        new_position.set_x(x=10)
-        self.assertEqual(new_position, transform.position)
-        transform.set_position(y=15)
-        new_position.set_y(y=15)
-        self.assertEqual(new_position, transform.position)
-        transform.set_position(z=20)
-        new_position.set_z(z=20)
-        self.assertEqual(new_position, transform.position)
-        transform.set_position(x=0, z=20)
-        new_position.set_x(x=0)
-        new_position.set_z(z=20)
-        self.assertEqual(new_position, transform.position)
-        transform.set_position(x=5, y=10)
-        new_position.set_x(x=5)
-        new_position.set_y(y=10)
-        self.assertEqual(new_position.get_as_tuple(), transform.position.get_as_tuple())
-
-    def test_transform_set_rotation_fewer_channels(self):
-        transform = core_transform.Transform()
-        new_rotation = core_transform.Vector3(1, 2, 3)
-        transform.set_rotation(xyz=new_rotation.get_as_tuple())
-        transform.set_rotation(x=10)
-        new_rotation.set_x(x=10)
-        self.assertEqual(new_rotation, transform.rotation)
-        transform.set_rotation(y=15)
-        new_rotation.set_y(y=15)
-        self.assertEqual(new_rotation, transform.rotation)
-        transform.set_rotation(z=20)
-        new_rotation.set_z(z=20)
-        self.assertEqual(new_rotation, transform.rotation)
-        transform.set_rotation(x=0, z=20)
-        new_rotation.set_x(x=0)
-        new_rotation.set_z(z=20)
-        self.assertEqual(new_rotation, transform.rotation)
-        transform.set_rotation(x=5, y=10)
-        new_rotation.set_x(x=5)
-        new_rotation.set_y(y=10)
-        self.assertEqual(new_rotation.get_as_tuple(), transform.rotation.get_as_tuple())
-
-    def test_transform_set_scale_fewer_channels(self):
-        transform = core_transform.Transform()
-        new_scale = core_transform.Vector3(1, 2, 3)
-        transform.set_scale(xyz=new_scale.get_as_tuple())
-        transform.set_scale(x=10)
-        new_scale.set_x(x=10)
-        self.assertEqual(new_scale, transform.scale)
-        transform.set_scale(y=15)
-        new_scale.set_y(y=15)
-        self.assertEqual(new_scale, transform.scale)
-        transform.set_scale(z=20)
-        new_scale.set_z(z=20)
-        self.assertEqual(new_scale, transform.scale)
-        transform.set_scale(x=0, z=20)
-        new_scale.set_x(x=0)
-        new_scale.set_z(z=20)
-        self.assertEqual(new_scale, transform.scale)
-        transform.set_scale(x=5, y=10)
-        new_scale.set_x(x=5)
-        new_scale.set_y(y=10)
-        self.assertEqual(new_scale.get_as_tuple(), transform.scale.get_as_tuple())
+    def test_transform_set_trs_xyz(self):
+        for channel, values in self.TRS_VALUES:
+            with self.subTest(channel=channel):
+                transform = core_transform.Transform()
+                new_value = core_transform.Vector3(*values)
+                getattr(transform, f"set_{channel}")(xyz=new_value)
+                self.assertEqual(new_value, getattr(transform, channel))
+
+    def test_transform_set_trs_arg(self):
+        for channel, values in self.TRS_VALUES:
+            with self.subTest(channel=channel):
+                transform = core_transform.Transform()
+                new_value = core_transform.Vector3(*values)
+                getattr(transform, f"set_{channel}")(*values)
+                self.assertEqual(new_value, getattr(transform, channel))
+
+    def test_transform_set_trs_tuple(self):
+        for channel, values in self.TRS_VALUES:
+            with self.subTest(channel=channel):
+                transform = core_transform.Transform()
+                new_value = core_transform.Vector3(*values)
+                getattr(transform, f"set_{channel}")(xyz=values)
+                self.assertEqual(new_value, getattr(transform, channel))
+
+    def test_transform_set_trs_fewer_channels(self):
+        cases = (
+            ({"x": 10}, (10, 2, 3)),
+            ({"y": 15}, (10, 15, 3)),
+            ({"z": 20}, (10, 15, 20)),
+            ({"x": 0, "z": 20}, (0, 15, 20)),
+            ({"x": 5, "y": 10}, (5, 10, 20)),
+        )
+        for channel, _ in self.TRS_VALUES:
+            with self.subTest(channel=channel):
+                transform = core_transform.Transform()
+                set_channel = getattr(transform, f"set_{channel}")
+                set_channel(xyz=(1, 2, 3))
+                for kwargs, expected in cases:
+                    set_channel(**kwargs)
+                    self.assertEqual(expected, getattr(transform, channel).get_as_tuple())
 
     def test_transform_set_trs_invalid_input(self):
         transform = core_transform.Transform()
@@ -462,41 +396,6 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(core_transform.Vector3(0, 0, 0), transform.rotation)
         self.assertEqual(core_transform.Vector3(1, 1, 1), transform.scale)
 
-    def test_transform_set_position_tuple(self):
-        transform = core_transform.Transform()
-        new_position = (1, 2, 3)
-        new_position_vector3 = core_transform.Vector3(*new_position)
-        transform.set_position(xyz=new_position)
-        self.assertEqual(new_position_vector3, transform.position)
-
-    def test_transform_set_rotation_tuple(self):
-        transform = core_transform.Transform()
-        new_rotation = (45, 0, 90)
-        new_rotation_vector3 = core_transform.Vector3(*new_rotation)
-        transform.set_rotation(xyz=new_rotation)
-        self.assertEqual(new_rotation_vector3, transform.rotation)
-
-    def test_transform_set_scale_tuple(self):
-        transform = core_transform.Transform()
-        new_scale = (2, 2, 2)
-        new_scale_vector3 = core_transform.Vector3(*new_scale)
-        transform.set_scale(xyz=new_scale)
-        self.assertEqual(new_scale_vector3, transform.scale)
-
-    def test_set_transform_from_object(self):
-        cube = maya_test_tools.create_poly_cube()
-        cmds.setAttr(f'{cube}.ty', 5)
-        cmds.setAttr(f'{cube}.ry', 35)
-        cmds.setAttr(f'{cube}.sy', 2)
-        transform = core_transform.Transform()
-        transform.set_transform_from_object(obj_name=cube)
-        expected_position = core_transform.Vector3(0, 5, 0)
-        self.assertEqual(expected_position, transform.position)
-        expected_rotate = core_transform.Vector3(0, 35, 0)
-        self.assertEqual(expected_rotate, transform.rotation)
-        expected_scale = core_transform.Vector3(1, 2, 1)
-        self.assertEqual(expected_scale, transform.scale)
-
     def test_get_position(self):
         transform = core_transform.Transform()
         new_pos = (2, 2, 2)
@@ -554,16 +453,121 @@ class TestTransformCore(unittest.TestCase):
 
     # -------------------------------------------------- Transform End ------------------------------------------------
 
+
+class TestTransformUtilsCore(unittest.TestCase):
+    def test_overwrite_xyz_values(self):
+        cases = (
+            (None, [1, 2, 3]),
+            ("x", [4, 2, 3]),
+            ("y", [1, 5, 3]),
+            ("z", [1, 2, 6]),
+            ("xyz", [4, 5, 6]),
+            (("x", "y", "z"), [4, 5, 6]),
+        )
+        for overwrite_dimensions, expected in cases:
+            with self.subTest(overwrite_dimensions=overwrite_dimensions):
+                result = core_transform.overwrite_xyz_values(
+                    passthrough_xyz=[1, 2, 3], overwrite_xyz=[4, 5, 6], overwrite_dimensions=overwrite_dimensions
+                )
+                self.assertEqual(expected, result)
+
+
+class TestTransformCore(unittest.TestCase):
+    # Source value used by the match tests and, for each "skip" argument, the axes expected to keep their defaults
+    MATCH_SOURCE_VALUE = 5
+    MATCH_SKIP_CASES = (
+        (None, ""),
+        ("x", "x"),
+        ("y", "y"),
+        ("z", "z"),
+        ("xyz", "xyz"),
+        (("x", "y", "z"), "xyz"),
+    )
+
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def assertAlmostEqualSigFig(self, arg1, arg2, tolerance=2):
+        """
+        Asserts that two numbers are almost equal up to a given number of significant figures.
+
+        Args:
+            self (object): The current test case or class object.
+            arg1 (float): The first number for comparison.
+            arg2 (float): The second number for comparison.
+            tolerance (int, optional): The number of significant figures to consider for comparison. Default is 2.
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError: If the significands of arg1 and arg2 differ by more than the specified tolerance.
+
+        Example:
+            obj = TestClass()
+            obj.assertAlmostEqualSigFig(3.145, 3.14159, tolerance=3)
+            # No assertion error will be raised as the first 3 significant figures are equal (3.14)
+        """
+        if tolerance > 1:
+            tolerance = tolerance - 1
+
+        str_formatter = '{0:.' + str(tolerance) + 'e}'
+        significand_1, exponent_1 = str_formatter.format(arg1).split('e')
+        significand_2, exponent_2 = str_formatter.format(arg2).split('e')
+
+        self.assertEqual(float(significand_1), float(significand_2))
+        self.assertEqual(int(exponent_1), int(exponent_2))
+
+    def assertXYZAlmostEqualSigFig(self, xyz_1, xyz_2, tolerance=2):
+        """
+        Asserts that two XYZ triples are almost equal, axis by axis, up to a given number of significant figures.
+
+        Args:
+            xyz_1 (tuple, list): The first triple for comparison.
+            xyz_2 (tuple, list): The second triple for comparison.
+            tolerance (int, optional): The number of significant figures to consider for comparison. Default is 2.
+        """
+        self.assertEqual(len(xyz_1), len(xyz_2))
+        for value_1, value_2 in zip(xyz_1, xyz_2):
+            self.assertAlmostEqualSigFig(value_1, value_2, tolerance=tolerance)
+
+    def assertCVPositionsAlmostEqual(self, expected, result, places=3):
+        """
+        Asserts that two lists of CV positions are almost equal, ignoring floating point noise (e.g. 6e-17 vs 0.0).
+
+        Args:
+            expected (list): A list of [x, y, z] lists with the expected positions.
+            result (list): A list of [x, y, z] lists with the positions to compare.
+            places (int, optional): Number of decimal places used for the comparison. Default is 3.
+        """
+        self.assertEqual(len(expected), len(result))
+        for expected_xyz, result_xyz in zip(expected, result):
+            self.assertEqual(len(expected_xyz), len(result_xyz))
+            for expected_value, result_value in zip(expected_xyz, result_xyz):
+                self.assertAlmostEqual(expected_value, result_value, places=places)
+
+    def test_set_transform_from_object(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.xform(cube, translation=(0, 5, 0), rotation=(0, 35, 0), scale=(1, 2, 1))
+        transform = core_transform.Transform()
+        transform.set_transform_from_object(obj_name=cube)
+        expected_position = core_transform.Vector3(0, 5, 0)
+        self.assertEqual(expected_position, transform.position)
+        expected_rotate = core_transform.Vector3(0, 35, 0)
+        self.assertEqual(expected_rotate, transform.rotation)
+        expected_scale = core_transform.Vector3(1, 2, 1)
+        self.assertEqual(expected_scale, transform.scale)
+
     def test_move_to_origin(self):
         cube = maya_test_tools.create_poly_cube()
-        cmds.setAttr(f"{cube}.tx", 5)
-        cmds.setAttr(f"{cube}.ty", 5)
-        cmds.setAttr(f"{cube}.tz", 5)
+        cmds.xform(cube, translation=(5, 5, 5))
         core_transform.move_to_origin(cube)
         expected = 0
-        result_x = cmds.getAttr(f"{cube}.tx")
-        result_y = cmds.getAttr(f"{cube}.ty")
-        result_z = cmds.getAttr(f"{cube}.tz")
+        result_x, result_y, result_z = cmds.xform(cube, query=True, translation=True)
         self.assertEqual(expected, result_x)
         self.assertEqual(expected, result_y)
         self.assertEqual(expected, result_z)
@@ -571,15 +575,11 @@ class TestTransformCore(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_move_selection_to_origin(self, mocked_stdout):
         cube = maya_test_tools.create_poly_cube()
-        cmds.setAttr(f"{cube}.tx", 5)
-        cmds.setAttr(f"{cube}.ty", 5)
-        cmds.setAttr(f"{cube}.tz", 5)
+        cmds.xform(cube, translation=(5, 5, 5))
         cmds.select(cube)
         core_transform.move_selection_to_origin()
         expected = 0
-        result_x = cmds.getAttr(f"{cube}.tx")
-        result_y = cmds.getAttr(f"{cube}.ty")
-        result_z = cmds.getAttr(f"{cube}.tz")
+        result_x, result_y, result_z = cmds.xform(cube, query=True, translation=True)
         self.assertEqual(expected, result_x)
         self.assertEqual(expected, result_y)
         self.assertEqual(expected, result_z)
@@ -587,407 +587,56 @@ class TestTransformCore(unittest.TestCase):
         expected = '"pCube1" was moved to the origin\n'
         self.assertEqual(expected, printed_value)
 
-    def test_overwrite_xyz_values(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions=None)
-        expected = [1, 2, 3]
-        self.assertEqual(expected, result)
-
-    def test_overwrite_xyz_values_overwrite_x(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions="x")
-        expected = [4, 2, 3]
-        self.assertEqual(expected, result)
-
-    def test_overwrite_xyz_values_overwrite_y(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions="y")
-        expected = [1, 5, 3]
-        self.assertEqual(expected, result)
-
-    def test_overwrite_xyz_values_overwrite_z(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions="z")
-        expected = [1, 2, 6]
-        self.assertEqual(expected, result)
-
-    def test_overwrite_xyz_values_overwrite_xyz(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions="xyz")
-        expected = [4, 5, 6]
-        self.assertEqual(expected, result)
-
-    def test_overwrite_xyz_values_overwrite_xyz_tuple(self):
-
-        result = core_transform.overwrite_xyz_values(passthrough_xyz=[1, 2, 3],
-                                                     overwrite_xyz=[4, 5, 6],
-                                                     overwrite_dimensions=('x', 'y', 'z'))
-        expected = [4, 5, 6]
-        self.assertEqual(expected, result)
-
     def test_match_translate(self):
         cube_source = maya_test_tools.create_poly_cube()
         cube_target_one = maya_test_tools.create_poly_cube()
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets)
-        expected = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected, result_x)
-            self.assertEqual(expected, result_y)
-            self.assertEqual(expected, result_z)
-
-    def test_match_translate_skip_x(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets, skip="x")
-        expected_x = 0
-        expected_y = 5
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_translate_skip_y(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets, skip="y")
-        expected_x = 5
-        expected_y = 0
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_translate_skip_z(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets, skip="z")
-        expected_x = 5
-        expected_y = 5
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_translate_skip_xyz(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets, skip="xyz")
-        expected_x = 0
-        expected_y = 0
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_translate_skip_xyz_tuple(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.tx", 5)
-        cmds.setAttr(f"{cube_source}.ty", 5)
-        cmds.setAttr(f"{cube_source}.tz", 5)
-        core_transform.match_translate(source=cube_source, target_list=targets, skip=("x", "y", "z"))
-        expected_x = 0
-        expected_y = 0
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
+        source_value = self.MATCH_SOURCE_VALUE
+        cmds.xform(cube_source, translation=(source_value, source_value, source_value))
+        for skip, skipped_axes in self.MATCH_SKIP_CASES:
+            expected = [0 if axis in skipped_axes else source_value for axis in "xyz"]
+            with self.subTest(skip=skip):
+                for cube in targets:  # Reset targets instead of creating new cubes for every case
+                    cmds.xform(cube, translation=(0, 0, 0))
+                core_transform.match_translate(source=cube_source, target_list=targets, skip=skip)
+                for cube in targets:
+                    result = cmds.xform(cube, query=True, translation=True)
+                    self.assertEqual(expected, result)
 
     def test_match_rotate(self):
         cube_source = maya_test_tools.create_poly_cube()
         cube_target_one = maya_test_tools.create_poly_cube()
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets)
-        expected = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected, result_x)
-            self.assertAlmostEqualSigFig(expected, result_y)
-            self.assertAlmostEqualSigFig(expected, result_z)
-
-    def test_match_rotate_skip_x(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets, skip="x")
-        expected_x = 0
-        expected_y = 5
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-
-    def test_match_rotate_skip_y(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets, skip="y")
-        expected_x = 5
-        expected_y = 0
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-
-    def test_match_rotate_skip_z(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets, skip="z")
-        expected_x = 5
-        expected_y = 5
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-
-    def test_match_rotate_skip_xyz(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets, skip="xyz")
-        expected_x = 0
-        expected_y = 0
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-
-    def test_match_rotate_skip_xyz_tuple(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.rx", 5)
-        cmds.setAttr(f"{cube_source}.ry", 5)
-        cmds.setAttr(f"{cube_source}.rz", 5)
-        core_transform.match_rotate(source=cube_source, target_list=targets, skip=("x", "y", "z"))
-        expected_x = 0
-        expected_y = 0
-        expected_z = 0
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
+        source_value = self.MATCH_SOURCE_VALUE
+        cmds.xform(cube_source, rotation=(source_value, source_value, source_value))
+        for skip, skipped_axes in self.MATCH_SKIP_CASES:
+            expected = [0 if axis in skipped_axes else source_value for axis in "xyz"]
+            with self.subTest(skip=skip):
+                for cube in targets:  # Reset targets instead of creating new cubes for every case
+                    cmds.xform(cube, rotation=(0, 0, 0))
+                core_transform.match_rotate(source=cube_source, target_list=targets, skip=skip)
+                for cube in targets:
+                    result = cmds.xform(cube, query=True, rotation=True)
+                    self.assertXYZAlmostEqualSigFig(expected, result)
 
     def test_match_scale(self):
         cube_source = maya_test_tools.create_poly_cube()
         cube_target_one = maya_test_tools.create_poly_cube()
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets)
-        expected = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected, result_x)
-            self.assertEqual(expected, result_y)
-            self.assertEqual(expected, result_z)
-
-    def test_match_scale_skip_x(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets, skip="x")
-        expected_x = 1
-        expected_y = 5
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_scale_skip_y(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets, skip="y")
-        expected_x = 5
-        expected_y = 1
-        expected_z = 5
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_scale_skip_z(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets, skip="z")
-        expected_x = 5
-        expected_y = 5
-        expected_z = 1
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_scale_skip_xyz(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets, skip="xyz")
-        expected_x = 1
-        expected_y = 1
-        expected_z = 1
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-
-    def test_match_scale_skip_xyz_tuple(self):
-        cube_source = maya_test_tools.create_poly_cube()
-        cube_target_one = maya_test_tools.create_poly_cube()
-        cube_target_two = maya_test_tools.create_poly_cube()
-        targets = [cube_target_one, cube_target_two]
-        cmds.setAttr(f"{cube_source}.sx", 5)
-        cmds.setAttr(f"{cube_source}.sy", 5)
-        cmds.setAttr(f"{cube_source}.sz", 5)
-        core_transform.match_scale(source=cube_source, target_list=targets, skip=('x', 'y', 'z'))
-        expected_x = 1
-        expected_y = 1
-        expected_z = 1
-        for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
+        source_value = self.MATCH_SOURCE_VALUE
+        cmds.xform(cube_source, scale=(source_value, source_value, source_value))
+        for skip, skipped_axes in self.MATCH_SKIP_CASES:
+            expected = [1 if axis in skipped_axes else source_value for axis in "xyz"]
+            with self.subTest(skip=skip):
+                for cube in targets:  # Reset targets instead of creating new cubes for every case
+                    cmds.xform(cube, scale=(1, 1, 1))
+                core_transform.match_scale(source=cube_source, target_list=targets, skip=skip)
+                for cube in targets:
+                    result = cmds.xform(cube, query=True, scale=True, relative=True)
+                    self.assertEqual(expected, result)
 
     def test_match_transform(self):
         cube_source = maya_test_tools.create_poly_cube()
@@ -995,17 +644,7 @@ class TestTransformCore(unittest.TestCase):
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
 
-        cmds.setAttr(f"{cube_source}.tx", 1)
-        cmds.setAttr(f"{cube_source}.ty", 2)
-        cmds.setAttr(f"{cube_source}.tz", 3)
-
-        cmds.setAttr(f"{cube_source}.rx", 1)
-        cmds.setAttr(f"{cube_source}.ry", 2)
-        cmds.setAttr(f"{cube_source}.rz", 3)
-
-        cmds.setAttr(f"{cube_source}.sx", 1)
-        cmds.setAttr(f"{cube_source}.sy", 2)
-        cmds.setAttr(f"{cube_source}.sz", 3)
+        cmds.xform(cube_source, translation=(1, 2, 3), rotation=(1, 2, 3), scale=(1, 2, 3))
 
         core_transform.match_transform(source=cube_source, target_list=targets)
 
@@ -1013,24 +652,12 @@ class TestTransformCore(unittest.TestCase):
         expected_y = 2
         expected_z = 3
         for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
+            result_xyz = cmds.xform(cube, query=True, translation=True)
+            self.assertEqual([expected_x, expected_y, expected_z], result_xyz)
+            result_xyz = cmds.xform(cube, query=True, rotation=True)
+            self.assertXYZAlmostEqualSigFig((expected_x, expected_y, expected_z), result_xyz)
+            result_xyz = cmds.xform(cube, query=True, scale=True, relative=True)
+            self.assertXYZAlmostEqualSigFig((expected_x, expected_y, expected_z), result_xyz)
 
     def test_match_transform_skip_xy(self):
         cube_source = maya_test_tools.create_poly_cube()
@@ -1038,17 +665,7 @@ class TestTransformCore(unittest.TestCase):
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
 
-        cmds.setAttr(f"{cube_source}.tx", 1)
-        cmds.setAttr(f"{cube_source}.ty", 2)
-        cmds.setAttr(f"{cube_source}.tz", 3)
-
-        cmds.setAttr(f"{cube_source}.rx", 1)
-        cmds.setAttr(f"{cube_source}.ry", 2)
-        cmds.setAttr(f"{cube_source}.rz", 3)
-
-        cmds.setAttr(f"{cube_source}.sx", 1)
-        cmds.setAttr(f"{cube_source}.sy", 2)
-        cmds.setAttr(f"{cube_source}.sz", 3)
+        cmds.xform(cube_source, translation=(1, 2, 3), rotation=(1, 2, 3), scale=(1, 2, 3))
 
         core_transform.match_transform(source=cube_source, target_list=targets,
                                        skip_translate="xy", skip_rotate="xy", skip_scale="xy")
@@ -1062,24 +679,12 @@ class TestTransformCore(unittest.TestCase):
         expected_sca_z = 3
 
         for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_x, result_x)
-            self.assertEqual(expected_y, result_y)
-            self.assertEqual(expected_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_x, result_x)
-            self.assertAlmostEqualSigFig(expected_y, result_y)
-            self.assertAlmostEqualSigFig(expected_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertAlmostEqualSigFig(expected_sca_x, result_x)
-            self.assertAlmostEqualSigFig(expected_sca_y, result_y)
-            self.assertAlmostEqualSigFig(expected_sca_z, result_z)
+            result_xyz = cmds.xform(cube, query=True, translation=True)
+            self.assertEqual([expected_x, expected_y, expected_z], result_xyz)
+            result_xyz = cmds.xform(cube, query=True, rotation=True)
+            self.assertXYZAlmostEqualSigFig((expected_x, expected_y, expected_z), result_xyz)
+            result_xyz = cmds.xform(cube, query=True, scale=True, relative=True)
+            self.assertXYZAlmostEqualSigFig((expected_sca_x, expected_sca_y, expected_sca_z), result_xyz)
 
     def test_match_transform_skip_translate(self):
         cube_source = maya_test_tools.create_poly_cube()
@@ -1087,17 +692,7 @@ class TestTransformCore(unittest.TestCase):
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
 
-        cmds.setAttr(f"{cube_source}.tx", 1)
-        cmds.setAttr(f"{cube_source}.ty", 2)
-        cmds.setAttr(f"{cube_source}.tz", 3)
-
-        cmds.setAttr(f"{cube_source}.rx", 1)
-        cmds.setAttr(f"{cube_source}.ry", 2)
-        cmds.setAttr(f"{cube_source}.rz", 3)
-
-        cmds.setAttr(f"{cube_source}.sx", 1)
-        cmds.setAttr(f"{cube_source}.sy", 2)
-        cmds.setAttr(f"{cube_source}.sz", 3)
+        cmds.xform(cube_source, translation=(1, 2, 3), rotation=(1, 2, 3), scale=(1, 2, 3))
 
         core_transform.match_transform(source=cube_source, target_list=targets, translate=False)
 
@@ -1113,24 +708,12 @@ class TestTransformCore(unittest.TestCase):
         expected_sca_y = 2
         expected_sca_z = 3
         for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_pos_x, result_x)
-            self.assertEqual(expected_pos_y, result_y)
-            self.assertEqual(expected_pos_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_rot_x, result_x)
-            self.assertAlmostEqualSigFig(expected_rot_y, result_y)
-            self.assertAlmostEqualSigFig(expected_rot_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertAlmostEqualSigFig(expected_sca_x, result_x)
-            self.assertAlmostEqualSigFig(expected_sca_y, result_y)
-            self.assertAlmostEqualSigFig(expected_sca_z, result_z)
+            result_xyz = cmds.xform(cube, query=True, translation=True)
+            self.assertEqual([expected_pos_x, expected_pos_y, expected_pos_z], result_xyz)
+            result_xyz = cmds.xform(cube, query=True, rotation=True)
+            self.assertXYZAlmostEqualSigFig((expected_rot_x, expected_rot_y, expected_rot_z), result_xyz)
+            result_xyz = cmds.xform(cube, query=True, scale=True, relative=True)
+            self.assertXYZAlmostEqualSigFig((expected_sca_x, expected_sca_y, expected_sca_z), result_xyz)
 
     def test_match_transform_skip_rotate(self):
         cube_source = maya_test_tools.create_poly_cube()
@@ -1138,17 +721,7 @@ class TestTransformCore(unittest.TestCase):
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
 
-        cmds.setAttr(f"{cube_source}.tx", 1)
-        cmds.setAttr(f"{cube_source}.ty", 2)
-        cmds.setAttr(f"{cube_source}.tz", 3)
-
-        cmds.setAttr(f"{cube_source}.rx", 1)
-        cmds.setAttr(f"{cube_source}.ry", 2)
-        cmds.setAttr(f"{cube_source}.rz", 3)
-
-        cmds.setAttr(f"{cube_source}.sx", 1)
-        cmds.setAttr(f"{cube_source}.sy", 2)
-        cmds.setAttr(f"{cube_source}.sz", 3)
+        cmds.xform(cube_source, translation=(1, 2, 3), rotation=(1, 2, 3), scale=(1, 2, 3))
 
         core_transform.match_transform(source=cube_source, target_list=targets, rotate=False)
 
@@ -1164,24 +737,12 @@ class TestTransformCore(unittest.TestCase):
         expected_sca_y = 2
         expected_sca_z = 3
         for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_pos_x, result_x)
-            self.assertEqual(expected_pos_y, result_y)
-            self.assertEqual(expected_pos_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_rot_x, result_x)
-            self.assertAlmostEqualSigFig(expected_rot_y, result_y)
-            self.assertAlmostEqualSigFig(expected_rot_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertAlmostEqualSigFig(expected_sca_x, result_x)
-            self.assertAlmostEqualSigFig(expected_sca_y, result_y)
-            self.assertAlmostEqualSigFig(expected_sca_z, result_z)
+            result_xyz = cmds.xform(cube, query=True, translation=True)
+            self.assertEqual([expected_pos_x, expected_pos_y, expected_pos_z], result_xyz)
+            result_xyz = cmds.xform(cube, query=True, rotation=True)
+            self.assertXYZAlmostEqualSigFig((expected_rot_x, expected_rot_y, expected_rot_z), result_xyz)
+            result_xyz = cmds.xform(cube, query=True, scale=True, relative=True)
+            self.assertXYZAlmostEqualSigFig((expected_sca_x, expected_sca_y, expected_sca_z), result_xyz)
 
     def test_match_transform_skip_scale(self):
         cube_source = maya_test_tools.create_poly_cube()
@@ -1189,17 +750,7 @@ class TestTransformCore(unittest.TestCase):
         cube_target_two = maya_test_tools.create_poly_cube()
         targets = [cube_target_one, cube_target_two]
 
-        cmds.setAttr(f"{cube_source}.tx", 1)
-        cmds.setAttr(f"{cube_source}.ty", 2)
-        cmds.setAttr(f"{cube_source}.tz", 3)
-
-        cmds.setAttr(f"{cube_source}.rx", 1)
-        cmds.setAttr(f"{cube_source}.ry", 2)
-        cmds.setAttr(f"{cube_source}.rz", 3)
-
-        cmds.setAttr(f"{cube_source}.sx", 1)
-        cmds.setAttr(f"{cube_source}.sy", 2)
-        cmds.setAttr(f"{cube_source}.sz", 3)
+        cmds.xform(cube_source, translation=(1, 2, 3), rotation=(1, 2, 3), scale=(1, 2, 3))
 
         core_transform.match_transform(source=cube_source, target_list=targets, scale=False)
 
@@ -1215,24 +766,12 @@ class TestTransformCore(unittest.TestCase):
         expected_sca_y = 1
         expected_sca_z = 1
         for cube in targets:
-            result_x = cmds.getAttr(f"{cube}.tx")
-            result_y = cmds.getAttr(f"{cube}.ty")
-            result_z = cmds.getAttr(f"{cube}.tz")
-            self.assertEqual(expected_pos_x, result_x)
-            self.assertEqual(expected_pos_y, result_y)
-            self.assertEqual(expected_pos_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.rx")
-            result_y = cmds.getAttr(f"{cube}.ry")
-            result_z = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(expected_rot_x, result_x)
-            self.assertAlmostEqualSigFig(expected_rot_y, result_y)
-            self.assertAlmostEqualSigFig(expected_rot_z, result_z)
-            result_x = cmds.getAttr(f"{cube}.sx")
-            result_y = cmds.getAttr(f"{cube}.sy")
-            result_z = cmds.getAttr(f"{cube}.sz")
-            self.assertAlmostEqualSigFig(expected_sca_x, result_x)
-            self.assertAlmostEqualSigFig(expected_sca_y, result_y)
-            self.assertAlmostEqualSigFig(expected_sca_z, result_z)
+            result_xyz = cmds.xform(cube, query=True, translation=True)
+            self.assertEqual([expected_pos_x, expected_pos_y, expected_pos_z], result_xyz)
+            result_xyz = cmds.xform(cube, query=True, rotation=True)
+            self.assertXYZAlmostEqualSigFig((expected_rot_x, expected_rot_y, expected_rot_z), result_xyz)
+            result_xyz = cmds.xform(cube, query=True, scale=True, relative=True)
+            self.assertXYZAlmostEqualSigFig((expected_sca_x, expected_sca_y, expected_sca_z), result_xyz)
 
     def test_set_equidistant_transforms(self):
         cube_start = maya_test_tools.create_poly_cube()
@@ -1244,282 +783,119 @@ class TestTransformCore(unittest.TestCase):
 
         targets = [cube_one, cube_two, cube_three]
 
-        cmds.setAttr(f"{cube_end}.ty", 10)
-        cmds.setAttr(f"{cube_end}.tz", 10)
-        cmds.setAttr(f"{cube_end}.rx", 90)
-
-        core_transform.set_equidistant_transforms(start=cube_start,
-                                                  end=cube_end,
-                                                  target_list=targets,
-                                                  skip_start_end=True,
-                                                  constraint='parent')
-
-        expected_values = {cube_one: [0, 2.5, 2.5,
-                                      21.59, 0, 0],
-                           cube_two: [0, 5, 5,
-                                      45, 0, 0],
-                           cube_three: [0, 7.5, 7.5,
-                                        68.4, 0, 0]}
-        for cube, expected in expected_values.items():
-            tx = cmds.getAttr(f"{cube}.tx")
-            ty = cmds.getAttr(f"{cube}.ty")
-            tz = cmds.getAttr(f"{cube}.tz")
-            rx = cmds.getAttr(f"{cube}.rx")
-            ry = cmds.getAttr(f"{cube}.ry")
-            rz = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(tx, expected[0])
-            self.assertAlmostEqualSigFig(ty, expected[1])
-            self.assertAlmostEqualSigFig(tz, expected[2])
-            self.assertAlmostEqualSigFig(rx, expected[3])
-            self.assertAlmostEqualSigFig(ry, expected[4])
-            self.assertAlmostEqualSigFig(rz, expected[5])
-
-    def test_set_equidistant_transforms_skip_start_end(self):
-        cube_start = maya_test_tools.create_poly_cube()
-        cube_end = maya_test_tools.create_poly_cube()
-
-        cube_one = maya_test_tools.create_poly_cube()
-        cube_two = maya_test_tools.create_poly_cube()
-        cube_three = maya_test_tools.create_poly_cube()
-
-        targets = [cube_one, cube_two, cube_three]
-
-        cmds.setAttr(f"{cube_end}.ty", 10)
-        cmds.setAttr(f"{cube_end}.tz", 10)
-        cmds.setAttr(f"{cube_end}.rx", 90)
-
-        core_transform.set_equidistant_transforms(start=cube_start,
-                                                  end=cube_end,
-                                                  target_list=targets,
-                                                  skip_start_end=False,
-                                                  constraint='parent')
-
-        expected_values = {cube_one: [0, 0, 0,
-                                      0, 0, 0],
-                           cube_two: [0, 5, 5,
-                                      45, 0, 0],
-                           cube_three: [0, 10, 10,
-                                        90, 0, 0]}
-        for cube, expected in expected_values.items():
-            tx = cmds.getAttr(f"{cube}.tx")
-            ty = cmds.getAttr(f"{cube}.ty")
-            tz = cmds.getAttr(f"{cube}.tz")
-            rx = cmds.getAttr(f"{cube}.rx")
-            ry = cmds.getAttr(f"{cube}.ry")
-            rz = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(tx, expected[0])
-            self.assertAlmostEqualSigFig(ty, expected[1])
-            self.assertAlmostEqualSigFig(tz, expected[2])
-            self.assertAlmostEqualSigFig(rx, expected[3])
-            self.assertAlmostEqualSigFig(ry, expected[4])
-            self.assertAlmostEqualSigFig(rz, expected[5])
-
-    def test_set_equidistant_transforms_point_type(self):
-        cube_start = maya_test_tools.create_poly_cube()
-        cube_end = maya_test_tools.create_poly_cube()
-
-        cube_one = maya_test_tools.create_poly_cube()
-        cube_two = maya_test_tools.create_poly_cube()
-        cube_three = maya_test_tools.create_poly_cube()
-
-        targets = [cube_one, cube_two, cube_three]
-
-        cmds.setAttr(f"{cube_end}.ty", 10)
-        cmds.setAttr(f"{cube_end}.tz", 10)
-        cmds.setAttr(f"{cube_end}.rx", 90)
-
-        core_transform.set_equidistant_transforms(start=cube_start,
-                                                  end=cube_end,
-                                                  target_list=targets,
-                                                  skip_start_end=False,
-                                                  constraint='point')
-
-        expected_values = {cube_one: [0, 0, 0,
-                                      0, 0, 0],
-                           cube_two: [0, 5, 5,
-                                      0, 0, 0],
-                           cube_three: [0, 10, 10,
-                                        0, 0, 0]}
-        for cube, expected in expected_values.items():
-            tx = cmds.getAttr(f"{cube}.tx")
-            ty = cmds.getAttr(f"{cube}.ty")
-            tz = cmds.getAttr(f"{cube}.tz")
-            rx = cmds.getAttr(f"{cube}.rx")
-            ry = cmds.getAttr(f"{cube}.ry")
-            rz = cmds.getAttr(f"{cube}.rz")
-            self.assertAlmostEqualSigFig(tx, expected[0])
-            self.assertAlmostEqualSigFig(ty, expected[1])
-            self.assertAlmostEqualSigFig(tz, expected[2])
-            self.assertAlmostEqualSigFig(rx, expected[3])
-            self.assertAlmostEqualSigFig(ry, expected[4])
-            self.assertAlmostEqualSigFig(rz, expected[5])
+        cmds.xform(cube_end, translation=(0, 10, 10), rotation=(90, 0, 0))
+
+        # skip_start_end, constraint, expected [tx, ty, tz, rx, ry, rz] for each target
+        cases = [
+            (True, 'parent', [[0, 2.5, 2.5, 21.59, 0, 0], [0, 5, 5, 45, 0, 0], [0, 7.5, 7.5, 68.4, 0, 0]]),
+            (False, 'parent', [[0, 0, 0, 0, 0, 0], [0, 5, 5, 45, 0, 0], [0, 10, 10, 90, 0, 0]]),
+            (False, 'point', [[0, 0, 0, 0, 0, 0], [0, 5, 5, 0, 0, 0], [0, 10, 10, 0, 0, 0]]),
+        ]
+        for skip_start_end, constraint, expected_values in cases:
+            with self.subTest(skip_start_end=skip_start_end, constraint=constraint):
+                for cube in targets:
+                    cmds.xform(cube, translation=(0, 0, 0), rotation=(0, 0, 0))
+                core_transform.set_equidistant_transforms(start=cube_start,
+                                                          end=cube_end,
+                                                          target_list=targets,
+                                                          skip_start_end=skip_start_end,
+                                                          constraint=constraint)
+                for cube, expected in zip(targets, expected_values):
+                    translation = cmds.xform(cube, query=True, translation=True)
+                    rotation = cmds.xform(cube, query=True, rotation=True)
+                    self.assertXYZAlmostEqualSigFig(translation, expected[:3])
+                    self.assertXYZAlmostEqualSigFig(rotation, expected[3:])
 
     def test_translate_shapes(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.translate_shapes(obj_transform=crv, offset=(1, 0, 0))
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
         expected = [[1.0, 0.0, 1.0], [1.0, 0.0, 0.667], [1.0, 0.0, 0.0],
                     [1.0, 0.0, -1.0], [1.0, 0.0, -1.667], [1.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(expected, cv_positions)
 
     def test_rotate_shapes(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.rotate_shapes(obj_transform=crv, offset=(90, 0, 0), pivot=None)
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
         expected = [[0.0, -1.0, 0.0], [0.0, -0.667, 0.0], [0.0, 0.0, 0.0],
                     [0.0, 1.0, 0.0], [0.0, 1.667, 0.0], [0.0, 2.0, 0.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(expected, cv_positions)
 
     def test_rotate_shapes_pivot(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.rotate_shapes(obj_transform=crv, offset=(0, 90, 0), pivot=(5, 0, 0))
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
         expected = [[6.0, 0.0, 5.0], [5.667, 0.0, 5.0], [5.0, 0.0, 5.0],
                     [4.0, 0.0, 5.0], [3.333, 0.0, 5.0], [3.0, 0.0, 5.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(expected, cv_positions)
 
     def test_scale_shapes_integer(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.scale_shapes(obj_transform=crv, offset=2, pivot=None)
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
         expected = [[0.0, 0.0, 2.0], [0.0, 0.0, 1.334], [0.0, 0.0, 0.0],
                     [0.0, 0.0, -2.0], [0.0, 0.0, -3.334], [0.0, 0.0, -4.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(expected, cv_positions)
 
     def test_scale_shapes_tuple(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.scale_shapes(obj_transform=crv, offset=(2, 1, 1), pivot=None)
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(CURVE_POINTS, cv_positions)
 
     def test_scale_shapes_pivot(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
 
-        num_cvs = cmds.getAttr(f"{crv}.spans")
-        num_cvs += cmds.getAttr(f"{crv}.degree")
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
-        expected = [[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                    [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertEqual(CURVE_POINTS, cv_positions)
 
         core_transform.scale_shapes(obj_transform=crv, offset=(2, 1, 1), pivot=(1, 2, 1))
 
-        cv_positions = []
-        for i in range(num_cvs):
-            cv_position = cmds.pointPosition(f"{crv}.cv[{i}]", world=True)
-            cv_positions.append(cv_position)
+        cv_positions = get_cv_positions(crv)
 
         expected = [[-1.0, 0.0, 1.0], [-1.0, 0.0, 0.667], [-1.0, 0.0, 0.0],
                     [-1.0, 0.0, -1.0], [-1.0, 0.0, -1.667], [-1.0, 0.0, -2.0]]
-        self.assertEqual(expected, cv_positions)
+        self.assertCVPositionsAlmostEqual(expected, cv_positions)
 
     def test_get_component_positions_as_dict_world_space(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
         cmds.move(0, 1, 0, crv)
         result = core_transform.get_component_positions_as_dict(obj_transform=crv,
                                                                 full_path=True,
@@ -1546,9 +922,7 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_get_component_positions_as_dict_object_space(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
         cmds.move(0, 1, 0, crv)
         result = core_transform.get_component_positions_as_dict(obj_transform=crv,
                                                                 full_path=True,
@@ -1606,9 +980,7 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_set_component_positions_from_dict_world_space(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
         cmds.move(0, 1, 0, crv)
 
         component_dict = {'|mocked_curve.cv[0]': [0.0, 0.0, 2.0]}
@@ -1630,9 +1002,7 @@ class TestTransformCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_set_component_positions_from_dict_object_space(self):
-        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.667], [0.0, 0.0, 0.0],
-                                                [0.0, 0.0, -1.0], [0.0, 0.0, -1.667], [0.0, 0.0, -2.0]],
-                                         degree=3, name='mocked_curve')
+        crv = create_test_curve()
         cmds.move(0, 1, 0, crv)
 
         component_dict = {'|mocked_curve.cv[0]': [0.0, 0.0, 2.0]}
@@ -17,12 +17,6 @@ from gt.core import version as core_version
 
 
 class TestVersionCore(unittest.TestCase):
-    def setUp(self):
-        maya_test_tools.delete_test_temp_dir()
-
-    def tearDown(self):
-        maya_test_tools.delete_test_temp_dir()
-
     def test_parse_semantic_tuple_version(self):
         expected = (1, 2, 3)
         result = core_version.parse_semantic_version(version_string="1.2.3", as_tuple=True)
@@ -116,6 +110,33 @@ class TestVersionCore(unittest.TestCase):
         result = core_version.compare_versions(version_a="2.2.3", version_b="1.6.7")
         self.assertEqual(expected, result)
 
+    def test_valid_versions(self):
+        # Valid semantic versions
+        versions = ["1.0.0", "2.3.4", "0.1.0", "10.20.30", "1.2.3-alpha", "1.2.3-alpha.2", "1.2.3+build123",
+                    "1.2.3+build123.foo", "1.0.0-beta.1+exp.sha.5114f85"]
+        for version in versions:
+            with self.subTest(version=version):
+                self.assertTrue(core_version.is_semantic_version(version))
+        self.assertTrue(core_version.is_semantic_version("1.2.3", metadata_ok=False))
+
+    def test_invalid_versions(self):
+        # Invalid semantic versions
+        versions = ["1.2", "1.3.4.5", "1.2.3-", "1.2.3+", "1.2.3.4", "v1.2.3", "1.2.3-beta..3", "1.2.3+exp@sha",
+                    "1.2.3random"]
+        for version in versions:
+            with self.subTest(version=version):
+                self.assertFalse(core_version.is_semantic_version(version))
+        self.assertFalse(core_version.is_semantic_version("1.2.3-alpha", metadata_ok=False))
+
+
+class TestVersionPackageCore(unittest.TestCase):
+    # Tests using the file system are kept here, so only they pay for the temp dir setup/cleanup
+    def setUp(self):
+        maya_test_tools.delete_test_temp_dir()
+
+    def tearDown(self):
+        maya_test_tools.delete_test_temp_dir()
+
     def test_get_package_version(self):
         test_temp_dir = maya_test_tools.generate_test_temp_dir()
         mocked_module_init = os.path.join(test_temp_dir, "__init__.py")
@@ -125,29 +146,3 @@ class TestVersionCore(unittest.TestCase):
         result = core_version.get_package_version(package_path=test_temp_dir)
         expected = '1.2.3'
         self.assertEqual(expected, result)
-
-    def test_valid_versions(self):
-        # Valid semantic versions
-        self.assertTrue(core_version.is_semantic_version("1.0.0"))
-        self.assertTrue(core_version.is_semantic_version("2.3.4"))
-        self.assertTrue(core_version.is_semantic_version("0.1.0"))
-        self.assertTrue(core_version.is_semantic_version("10.20.30"))
-        self.assertTrue(core_version.is_semantic_version("1.2.3-alpha"))
-        self.assertTrue(core_version.is_semantic_version("1.2.3-alpha.2"))
-        self.assertTrue(core_version.is_semantic_version("1.2.3+build123"))
-        self.assertTrue(core_version.is_semantic_version("1.2.3+build123.foo"))
-        self.assertTrue(core_version.is_semantic_version("1.0.0-beta.1+exp.sha.5114f85"))
-        self.assertTrue(core_version.is_semantic_version("1.2.3", metadata_ok=False))
-
-    def test_invalid_versions(self):
-        # Invalid semantic versions
-        self.assertFalse(core_version.is_semantic_version("1.2"))
-        self.assertFalse(core_version.is_semantic_version("1.3.4.5"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3-"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3+"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3.4"))
-        self.assertFalse(core_version.is_semantic_version("v1.2.3"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3-beta..3"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3+exp@sha"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3random"))
-        self.assertFalse(core_version.is_semantic_version("1.2.3-alpha", metadata_ok=False))
@@ -1,4 +1,4 @@
-import inspect
+import functools
 import gt.core.str as core_str
 import gt.ui.resource_library as ui_res_lib
 import gt.tools.auto_rigger.rig_framework as tools_rig_fmr
@@ -38,6 +38,19 @@ class RigModules:
     ModulePython = tools_mod_utils.ModulePython
     ModuleSaveScene = tools_mod_utils.ModuleSaveScene
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_cached_dict_modules():
+        """
+        Collects the module classes stored in the RigModules class. These are fixed at import time, so the result is
+        cached after the first call. Use "get_dict_modules" to get a copy that is safe to modify.
+        Returns:
+            dict: Dictionary where the key is the name of the module and value is the class.
+        """
+        modules_attrs = vars(RigModules)
+        class_attributes = {name: value for name, value in modules_attrs.items() if isinstance(value, type)}
+        return class_attributes
+
     @staticmethod
     def get_dict_modules():
         """
@@ -46,9 +59,7 @@ class RigModules:
             dict: Dictionary where the key is the name of the module and value is the class.
                   e.g. 'ModuleBipedArm': <class 'ModuleBipedArm'>
         """
-        modules_attrs = vars(RigModules)
-        class_attributes = {name: value for name, value in modules_attrs.items() if inspect.isclass(value)}
-        return class_attributes
+        return dict(RigModules._get_cached_dict_modules())
 
     @staticmethod
     def get_modules():
@@ -57,7 +68,7 @@ class RigModules:
         Returns:
             list: A list of modules, these use the ModuleGeneric as their base.
         """
-        return list(RigModules.get_dict_modules().values())
+        return list(RigModules._get_cached_dict_modules().values())
 
     @staticmethod
     def get_module_names():
@@ -66,7 +77,7 @@ class RigModules:
         Returns:
             list: A list of module names (strings)
         """
-        return list(RigModules.get_dict_modules().keys())
+        return list(RigModules._get_cached_dict_modules().keys())
 
 
 class RigModulesCategories:
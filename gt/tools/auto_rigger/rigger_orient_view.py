@@ -2,7 +2,6 @@
 OrientationData View
 """
 
-import gt.tools.auto_rigger.rig_framework as tools_rig_frm
 import gt.ui.resource_library as ui_res_lib
 import gt.ui.qt_utils as ui_qt_utils
 import gt.ui.qt_import as ui_qt
@@ -13,6 +12,15 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Window stylesheet, combined once at import instead of every time the view is opened
+_WINDOW_STYLESHEET = (
+    ui_res_lib.Stylesheet.scroll_bar_base
+    + ui_res_lib.Stylesheet.maya_dialog_base
+    + ui_res_lib.Stylesheet.list_widget_base
+    + ui_res_lib.Stylesheet.btn_radio_base
+    + ui_res_lib.Stylesheet.combobox_base
+)
+
 
 class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
     def __init__(self, parent=None, module=None):
@@ -71,12 +79,7 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
         )
         self.setWindowIcon(ui_qt.QtGui.QIcon(ui_res_lib.Icon.tool_orient_joints))
 
-        stylesheet = ui_res_lib.Stylesheet.scroll_bar_base
-        stylesheet += ui_res_lib.Stylesheet.maya_dialog_base
-        stylesheet += ui_res_lib.Stylesheet.list_widget_base
-        stylesheet += ui_res_lib.Stylesheet.btn_radio_base
-        stylesheet += ui_res_lib.Stylesheet.combobox_base
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(_WINDOW_STYLESHEET)
 
         self.save_orient_btn.setStyleSheet(ui_res_lib.Stylesheet.btn_push_bright)
         self.cancel_btn.setStyleSheet(ui_res_lib.Stylesheet.btn_push_base)
@@ -109,48 +112,44 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
         self.settings_label.setFont(ui_qt_utils.get_font(ui_res_lib.Font.roboto))
         self.settings_label.setFixedHeight(self.settings_label.sizeHint().height())
 
-        self.aim_axis_label = ui_qt.QtWidgets.QLabel("Aim Axis:")
-        self.aim_axis_grp = ui_qt.QtWidgets.QButtonGroup()
-        self.aim_axis_x = ui_qt.QtWidgets.QRadioButton("X")
-        self.aim_axis_y = ui_qt.QtWidgets.QRadioButton("Y")
-        self.aim_axis_z = ui_qt.QtWidgets.QRadioButton("Z")
-        self.aim_axis_grp.addButton(self.aim_axis_x)
-        self.aim_axis_grp.addButton(self.aim_axis_y)
-        self.aim_axis_grp.addButton(self.aim_axis_z)
-        self.up_axis_label = ui_qt.QtWidgets.QLabel("Up Axis:")
-        self.up_axis_grp = ui_qt.QtWidgets.QButtonGroup()
-        self.up_axis_x = ui_qt.QtWidgets.QRadioButton("X")
-        self.up_axis_y = ui_qt.QtWidgets.QRadioButton("Y")
-        self.up_axis_z = ui_qt.QtWidgets.QRadioButton("Z")
-        self.up_axis_grp.addButton(self.up_axis_x)
-        self.up_axis_grp.addButton(self.up_axis_y)
-        self.up_axis_grp.addButton(self.up_axis_z)
-        self.up_dir_label = ui_qt.QtWidgets.QLabel("Up Dir:")
-        self.up_dir_grp = ui_qt.QtWidgets.QButtonGroup()
-        self.up_dir_x = ui_qt.QtWidgets.QRadioButton("X")
-        self.up_dir_y = ui_qt.QtWidgets.QRadioButton("Y")
-        self.up_dir_z = ui_qt.QtWidgets.QRadioButton("Z")
-        self.up_dir_grp.addButton(self.up_dir_x)
-        self.up_dir_grp.addButton(self.up_dir_y)
-        self.up_dir_grp.addButton(self.up_dir_z)
-
-        self.aim_axis_mod = ui_qt.QtWidgets.QComboBox()
-        self.up_axis_mod = ui_qt.QtWidgets.QComboBox()
-        self.up_dir_mod = ui_qt.QtWidgets.QComboBox()
-        for combobox in [self.aim_axis_mod, self.up_axis_mod, self.up_dir_mod]:
-            combobox.addItem("+")
-            combobox.addItem("-")
-            combobox.setMaximumWidth(50)
-            combobox.setMinimumWidth(50)
+        _widgets = self._create_axis_widgets("Aim Axis:")
+        self.aim_axis_label, self.aim_axis_grp, _radio_buttons, self.aim_axis_mod = _widgets
+        self.aim_axis_x, self.aim_axis_y, self.aim_axis_z = _radio_buttons
+        _widgets = self._create_axis_widgets("Up Axis:")
+        self.up_axis_label, self.up_axis_grp, _radio_buttons, self.up_axis_mod = _widgets
+        self.up_axis_x, self.up_axis_y, self.up_axis_z = _radio_buttons
+        _widgets = self._create_axis_widgets("Up Dir:")
+        self.up_dir_label, self.up_dir_grp, _radio_buttons, self.up_dir_mod = _widgets
+        self.up_dir_x, self.up_dir_y, self.up_dir_z = _radio_buttons
 
         self.save_orient_btn = ui_qt.QtWidgets.QPushButton("Save Orientation")
-        self.save_orient_btn.setStyleSheet("padding: 10;")
         self.save_orient_btn.setSizePolicy(ui_qt.QtLib.SizePolicy.Expanding, ui_qt.QtLib.SizePolicy.Expanding)
 
         self.cancel_btn = ui_qt.QtWidgets.QPushButton("Cancel")
-        self.cancel_btn.setStyleSheet("padding: 10;")
         self.cancel_btn.setSizePolicy(ui_qt.QtLib.SizePolicy.Expanding, ui_qt.QtLib.SizePolicy.Expanding)
 
+    @staticmethod
+    def _create_axis_widgets(label_text):
+        """
+        Creates the widgets used to describe one axis: a label, X, Y and Z radio buttons and a modifier combobox.
+        Args:
+            label_text (str): Text of the label. e.g. "Aim Axis:"
+        Returns:
+            tuple: A tuple with the label (QLabel), the button group (QButtonGroup), a tuple with the X, Y and Z
+                   radio buttons (QRadioButton, group IDs 0, 1 and 2) and the combobox (QComboBox).
+        """
+        label = ui_qt.QtWidgets.QLabel(label_text)
+        button_group = ui_qt.QtWidgets.QButtonGroup()
+        radio_buttons = tuple(ui_qt.QtWidgets.QRadioButton(axis) for axis in ("X", "Y", "Z"))
+        for _id, radio_button in enumerate(radio_buttons):
+            button_group.addButton(radio_button, _id)
+        combobox = ui_qt.QtWidgets.QComboBox()
+        combobox.addItem("+")
+        combobox.addItem("-")
+        combobox.setMaximumWidth(50)
+        combobox.setMinimumWidth(50)
+        return label, button_group, radio_buttons, combobox
+
     def create_layout(self):
         """Create the layout for the window."""
         body_layout = ui_qt.QtWidgets.QVBoxLayout()
@@ -211,21 +210,28 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
             _value = -1
         return _value
 
+    def _get_axis_tuple(self, button_group, combobox):
+        """
+        Gets a tuple describing the axis selected in a group of X, Y and Z radio buttons.
+        Args:
+            button_group (QButtonGroup): Button group with the X, Y and Z radio buttons (IDs 0, 1 and 2).
+            combobox (QComboBox): Modifier combobox ("+" or "-") used as the value of the checked axis.
+        Returns:
+            tuple: A tuple describing the axis data. e.g. (1, 0, 0) = X+
+        """
+        _axis_list = [0, 0, 0]
+        _checked_id = button_group.checkedId()  # -1 when nothing is checked
+        if _checked_id >= 0:
+            _axis_list[_checked_id] = self._get_mod_value_as_int(combobox)
+        return tuple(_axis_list)
+
     def get_aim_axis_tuple(self):
         """
         Gets a tuple with the aim axis data. e.g. (1, 0, 0) = X+
         Returns:
             tuple: A tuple describing the aim axis data
         """
-        aim_axis_buttons = self.aim_axis_grp.buttons()
-        _mod_value = self._get_mod_value_as_int(self.aim_axis_mod)
-        _aim_list = []
-        for btn in aim_axis_buttons:
-            if btn.isChecked():
-                _aim_list.append(_mod_value)
-            else:
-                _aim_list.append(0)
-        return tuple(_aim_list)
+        return self._get_axis_tuple(self.aim_axis_grp, self.aim_axis_mod)
 
     def get_up_axis_tuple(self):
         """
@@ -233,15 +239,7 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
         Returns:
             tuple: A tuple describing the up axis data
         """
-        up_axis_buttons = self.up_axis_grp.buttons()
-        _mod_value = self._get_mod_value_as_int(self.up_axis_mod)
-        _up_list = []
-        for btn in up_axis_buttons:
-            if btn.isChecked():
-                _up_list.append(_mod_value)
-            else:
-                _up_list.append(0)
-        return tuple(_up_list)
+        return self._get_axis_tuple(self.up_axis_grp, self.up_axis_mod)
 
     def get_up_dir_tuple(self):
         """
@@ -249,81 +247,59 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
         Returns:
             tuple: A tuple describing the up dir data
         """
-        up_dir_buttons = self.up_dir_grp.buttons()
-        _mod_value = self._get_mod_value_as_int(self.up_dir_mod)
-        _up_dir_list = []
-        for btn in up_dir_buttons:
-            if btn.isChecked():
-                _up_dir_list.append(_mod_value)
-            else:
-                _up_dir_list.append(0)
-        return tuple(_up_dir_list)
+        return self._get_axis_tuple(self.up_dir_grp, self.up_dir_mod)
 
     def set_view_to_module_data(self):
         """
         Extracts the current data stored in the module and configures the view to match it
         """
-        self.aim_axis_x.setChecked(True)
-        self.up_axis_y.setChecked(True)
-        self.up_dir_y.setChecked(True)
         _orientation = self.module.get_orientation_data()
 
         try:
-            x, y, z = _orientation.get_aim_axis() or (0, 0, 0)
-            if x != 0:
-                self.aim_axis_x.setChecked(True)
-            elif y != 0:
-                self.aim_axis_y.setChecked(True)
-            elif z != 0:
-                self.aim_axis_z.setChecked(True)
-            # Modifier
-            _mod_value = x + y + z
-            if _mod_value > 0:
-                self.aim_axis_mod.setCurrentIndex(0)
-            else:
-                self.aim_axis_mod.setCurrentIndex(1)
+            self._set_axis_from_tuple(_orientation.get_aim_axis(), self.aim_axis_grp, self.aim_axis_mod, default_id=0)
         except Exception as e:
+            self.aim_axis_x.setChecked(True)  # Default
             logger.debug(f"Unable to retrieve aim axis from OrientationData. Issue: {e}")
 
         try:
-            x, y, z = _orientation.get_up_axis() or (0, 0, 0)
-            if x != 0:
-                self.up_axis_x.setChecked(True)
-            elif y != 0:
-                self.up_axis_y.setChecked(True)
-            elif z != 0:
-                self.up_axis_z.setChecked(True)
-            # Modifier
-            _mod_value = x + y + z
-            if _mod_value > 0:
-                self.up_axis_mod.setCurrentIndex(0)
-            else:
-                self.up_axis_mod.setCurrentIndex(1)
+            self._set_axis_from_tuple(_orientation.get_up_axis(), self.up_axis_grp, self.up_axis_mod, default_id=1)
         except Exception as e:
+            self.up_axis_y.setChecked(True)  # Default
             logger.debug(f"Unable to retrieve up axis from OrientationData. Issue: {e}")
 
         try:
-            x, y, z = _orientation.get_up_dir() or (0, 0, 0)
-            if x != 0:
-                self.up_dir_x.setChecked(True)
-            elif y != 0:
-                self.up_dir_y.setChecked(True)
-            elif z != 0:
-                self.up_dir_z.setChecked(True)
-            # Modifier
-            _mod_value = x + y + z
-            if _mod_value > 0:
-                self.up_dir_mod.setCurrentIndex(0)
-            else:
-                self.up_dir_mod.setCurrentIndex(1)
+            self._set_axis_from_tuple(_orientation.get_up_dir(), self.up_dir_grp, self.up_dir_mod, default_id=1)
         except Exception as e:
+            self.up_dir_y.setChecked(True)  # Default
             logger.debug(f"Unable to retrieve up direction from OrientationData. Issue: {e}")
 
+    @staticmethod
+    def _set_axis_from_tuple(axis_tuple, button_group, combobox, default_id=0):
+        """
+        Checks the radio button and sets the modifier described by an axis tuple. e.g. (0, -1, 0) = Y-
+        Args:
+            axis_tuple (tuple, None): Axis data. The first non-zero value determines the checked axis.
+            button_group (QButtonGroup): Button group with the X, Y and Z radio buttons (IDs 0, 1 and 2).
+            combobox (QComboBox): Modifier combobox ("+" or "-").
+            default_id (int, optional): ID of the button checked when the tuple has no axis. e.g. (0, 0, 0)
+        """
+        x, y, z = axis_tuple or (0, 0, 0)
+        for _id, _value in enumerate((x, y, z)):
+            if _value != 0:
+                button_group.button(_id).setChecked(True)
+                break
+        else:
+            button_group.button(default_id).setChecked(True)
+        # Modifier
+        combobox.setCurrentIndex(0 if x + y + z > 0 else 1)
+
     def save_orientation_to_module(self):
         """
         Saves the orientation described in the view back into the module
         """
-        _new_orientation = tools_rig_frm.OrientationData()
+        from gt.tools.auto_rigger.rig_framework import OrientationData
+
+        _new_orientation = OrientationData()
         _new_orientation.set_aim_axis(aim_axis=self.get_aim_axis_tuple())
         _new_orientation.set_up_axis(up_axis=self.get_up_axis_tuple())
         _new_orientation.set_up_dir(up_dir=self.get_up_dir_tuple())
@@ -336,11 +312,11 @@ class RiggerOrientView(metaclass=ui_qt_utils.MayaWindowMeta):
 
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
-    from gt.tools.auto_rigger.rig_framework import ModuleGeneric
+    from gt.tools.auto_rigger.rig_framework import ModuleGeneric, OrientationData
 
     _a_module = ModuleGeneric(name="My Module")
-    _an_orientation = tools_rig_frm.OrientationData(
-        method=tools_rig_frm.OrientationData.Methods.automatic,
+    _an_orientation = OrientationData(
+        method=OrientationData.Methods.automatic,
         aim_axis=(0, -1, 0),
         up_axis=(1, 0, 0),
         up_dir=(0, 0, -1),